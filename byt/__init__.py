@@ -26,3 +26,13 @@
 
 
 from .byt import *
+from .builder import *
+from .schema import *
+from .framer import *
+from .patterns import *
+from .rope import *
+from .bits import *
+from . import checksum
+from . import batch
+from . import instrument
+from . import fast
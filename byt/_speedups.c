@@ -0,0 +1,413 @@
+/*
+ * Byt - Copyright 2017 Guillaume Schworer
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ * Optional compiled accelerator of the hottest Byt methods (python 3.7+)
+ *
+ * install() replaces construction, indexing, iteration and the equality
+ * comparisons of the Byt class by C-level methods. Only the common cases
+ * are handled here, every other input goes to the original python
+ * method, so that the behaviour stays identical.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#if PY_VERSION_HEX < 0x03070000
+#error "byt._speedups requires python 3.7+"
+#endif
+
+
+/* the Byt class, once installed */
+static PyTypeObject *Byt = NULL;
+/* python-side dict of the single-octet tables, and its builder */
+static PyObject *singles_cache = NULL;
+static PyObject *singles_fct = NULL;
+/* the original python methods, for the uncommon inputs */
+static PyObject *py_new = NULL;
+static PyObject *py_getitem = NULL;
+static PyObject *py_eq = NULL;
+static PyObject *py_ne = NULL;
+
+
+/* Returns a new reference to the table of the 256 single-octet
+ * instances of cls */
+static PyObject *
+get_singles(PyObject *cls)
+{
+    PyObject *table = PyDict_GetItemWithError(singles_cache, cls);
+    if (table != NULL) {
+        Py_INCREF(table);
+        return table;
+    }
+    if (PyErr_Occurred())
+        return NULL;
+    return PyObject_CallFunctionObjArgs(singles_fct, cls, NULL);
+}
+
+
+/* Returns a new reference to the shared single-octet cls instance */
+static PyObject *
+get_single(PyObject *cls, unsigned char code)
+{
+    PyObject *item, *table = get_singles(cls);
+    if (table == NULL)
+        return NULL;
+    item = PyList_GET_ITEM(table, code);
+    Py_INCREF(item);
+    Py_DECREF(table);
+    return item;
+}
+
+
+/* Returns the cls instance copied from value, as bytes.__new__ */
+static PyObject *
+bytes_new(PyObject *cls, PyObject *value)
+{
+    PyObject *res, *args = PyTuple_Pack(1, value);
+    if (args == NULL)
+        return NULL;
+    res = PyBytes_Type.tp_new((PyTypeObject *)cls, args, NULL);
+    Py_DECREF(args);
+    return res;
+}
+
+
+/* Calls a python fallback with positional arguments */
+static PyObject *
+fallback(PyObject *fct, PyObject *const *args, Py_ssize_t nargs)
+{
+    Py_ssize_t i;
+    PyObject *res, *tuple = PyTuple_New(nargs);
+    if (tuple == NULL)
+        return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        PyTuple_SET_ITEM(tuple, i, args[i]);
+    }
+    res = PyObject_Call(fct, tuple, NULL);
+    Py_DECREF(tuple);
+    return res;
+}
+
+
+/* Byt.__new__(cls, value), dispatched on the exact type of value */
+static PyObject *
+byt_new(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *cls, *value, *encoded, *res;
+    PyTypeObject *tp;
+    long code;
+    int overflow;
+
+    /* cls may be anything from python code, the fallback raises */
+    if (nargs != 2 || !PyType_Check(args[0])
+            || !PyType_IsSubtype((PyTypeObject *)args[0], Byt))
+        return fallback(py_new, args, nargs);
+    cls = args[0];
+    value = args[1];
+    tp = Py_TYPE(value);
+    if ((PyObject *)tp == cls) {
+        /* immutable, share it */
+        Py_INCREF(value);
+        return value;
+    }
+    if (tp == &PyLong_Type) {
+        code = PyLong_AsLongAndOverflow(value, &overflow);
+        if (code == -1 && PyErr_Occurred())
+            return NULL;
+        if (overflow || code < 0 || code > 255) {
+            PyErr_SetString(PyExc_ValueError,
+                            "byte must be in range(0, 256)");
+            return NULL;
+        }
+        return get_single(cls, (unsigned char)code);
+    }
+    if (tp == &PyBytes_Type || tp == &PyByteArray_Type
+            || tp == &PyMemoryView_Type || tp == &PyList_Type
+            || tp == &PyTuple_Type)
+        return bytes_new(cls, value);
+    if (tp == &PyUnicode_Type) {
+        encoded = PyUnicode_AsEncodedString(value, "ISO-8859-1", NULL);
+        if (encoded == NULL)
+            return NULL;
+        res = bytes_new(cls, encoded);
+        Py_DECREF(encoded);
+        return res;
+    }
+    return fallback(py_new, args, nargs);
+}
+
+
+/* Byt.__getitem__(self, pos) */
+static PyObject *
+byt_getitem(PyObject *self, PyObject *pos)
+{
+    PyObject *res, *cast;
+    Py_ssize_t i, n;
+
+    if (PyLong_CheckExact(pos)) {
+        i = PyLong_AsSsize_t(pos);
+        n = PyBytes_GET_SIZE(self);
+        if (i == -1 && PyErr_Occurred())
+            PyErr_Clear();
+        else {
+            if (i < 0)
+                i += n;
+            if (0 <= i && i < n)
+                return get_single((PyObject *)Py_TYPE(self),
+                                  (unsigned char)PyBytes_AS_STRING(self)[i]);
+        }
+    }
+    else if (PySlice_Check(pos)) {
+        res = PyBytes_Type.tp_as_mapping->mp_subscript(self, pos);
+        if (res == NULL)
+            return NULL;
+        cast = PyObject_CallFunctionObjArgs((PyObject *)Py_TYPE(self), res,
+                                            NULL);
+        Py_DECREF(res);
+        return cast;
+    }
+    /* out of range or uncommon index, the fallback raises */
+    return PyObject_CallFunctionObjArgs(py_getitem, self, pos, NULL);
+}
+
+
+/* iterator of the shared single-octet instances of a Byt */
+typedef struct {
+    PyObject_HEAD
+    PyObject *value;
+    PyObject *table;
+    Py_ssize_t index;
+} BytIterObject;
+
+
+static void
+bytiter_dealloc(BytIterObject *it)
+{
+    PyObject_GC_UnTrack(it);
+    Py_XDECREF(it->value);
+    Py_XDECREF(it->table);
+    PyObject_GC_Del(it);
+}
+
+
+static int
+bytiter_traverse(BytIterObject *it, visitproc visit, void *arg)
+{
+    Py_VISIT(it->value);
+    Py_VISIT(it->table);
+    return 0;
+}
+
+
+static PyObject *
+bytiter_next(BytIterObject *it)
+{
+    PyObject *item;
+    if (it->value == NULL)
+        return NULL;
+    if (it->index < PyBytes_GET_SIZE(it->value)) {
+        item = PyList_GET_ITEM(it->table, (unsigned char)
+                               PyBytes_AS_STRING(it->value)[it->index++]);
+        Py_INCREF(item);
+        return item;
+    }
+    /* exhausted, release the bytes-chain */
+    Py_CLEAR(it->value);
+    Py_CLEAR(it->table);
+    return NULL;
+}
+
+
+static PyObject *
+bytiter_length_hint(BytIterObject *it, PyObject *Py_UNUSED(ignored))
+{
+    Py_ssize_t n = 0;
+    if (it->value != NULL)
+        n = PyBytes_GET_SIZE(it->value) - it->index;
+    return PyLong_FromSsize_t(n);
+}
+
+
+static PyMethodDef bytiter_methods[] = {
+    {"__length_hint__", (PyCFunction)bytiter_length_hint, METH_NOARGS,
+     NULL},
+    {NULL, NULL}
+};
+
+
+static PyTypeObject BytIterType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "byt._speedups.BytIterator",
+    .tp_basicsize = sizeof(BytIterObject),
+    .tp_dealloc = (destructor)bytiter_dealloc,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_traverse = (traverseproc)bytiter_traverse,
+    .tp_iter = PyObject_SelfIter,
+    .tp_iternext = (iternextfunc)bytiter_next,
+    .tp_methods = bytiter_methods,
+};
+
+
+/* Byt.__iter__(self) */
+static PyObject *
+byt_iter(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    BytIterObject *it;
+    PyObject *table = get_singles((PyObject *)Py_TYPE(self));
+    if (table == NULL)
+        return NULL;
+    it = PyObject_GC_New(BytIterObject, &BytIterType);
+    if (it == NULL) {
+        Py_DECREF(table);
+        return NULL;
+    }
+    Py_INCREF(self);
+    it->value = self;
+    it->table = table;
+    it->index = 0;
+    PyObject_GC_Track(it);
+    return (PyObject *)it;
+}
+
+
+/* Byt.__eq__ and Byt.__ne__, natively between two Byt */
+static PyObject *
+byt_compare(PyObject *self, PyObject *other, int op, PyObject *fct)
+{
+    if (PyObject_TypeCheck(other, Byt))
+        return PyBytes_Type.tp_richcompare(self, other, op);
+    return PyObject_CallFunctionObjArgs(fct, self, other, NULL);
+}
+
+
+static PyObject *
+byt_eq(PyObject *self, PyObject *other)
+{
+    return byt_compare(self, other, Py_EQ, py_eq);
+}
+
+
+static PyObject *
+byt_ne(PyObject *self, PyObject *other)
+{
+    return byt_compare(self, other, Py_NE, py_ne);
+}
+
+
+static PyMethodDef new_def = {
+    "__new__", (PyCFunction)(void(*)(void))byt_new, METH_FASTCALL,
+    "Create and return a new object."
+};
+
+
+static PyMethodDef byt_methods[] = {
+    {"__getitem__", (PyCFunction)byt_getitem, METH_O, NULL},
+    {"__iter__", (PyCFunction)byt_iter, METH_NOARGS, NULL},
+    {"__eq__", (PyCFunction)byt_eq, METH_O, NULL},
+    {"__ne__", (PyCFunction)byt_ne, METH_O, NULL},
+    {NULL, NULL}
+};
+
+
+/* Stores a new reference to the attribute name of cls into *dest */
+static int
+keep(PyObject **dest, PyObject *cls, const char *name)
+{
+    Py_XSETREF(*dest, PyObject_GetAttrString(cls, name));
+    return *dest == NULL ? -1 : 0;
+}
+
+
+static PyObject *
+install(PyObject *module, PyObject *args)
+{
+    PyObject *cls, *cache, *fct, *descr, *fn, *static_new;
+    PyMethodDef *def;
+
+    if (!PyArg_ParseTuple(args, "O!O!O:install", &PyType_Type, &cls,
+                          &PyDict_Type, &cache, &fct))
+        return NULL;
+    if (!PyType_IsSubtype((PyTypeObject *)cls, &PyBytes_Type)) {
+        PyErr_SetString(PyExc_TypeError, "can't accelerate non-bytes class");
+        return NULL;
+    }
+    /* the state is per process: a reloaded byt module gets a new class,
+       which stays pure python */
+    if (Byt != NULL)
+        return PyBool_FromLong((PyObject *)Byt == cls);
+    if (keep(&py_new, cls, "__new__") < 0
+            || keep(&py_getitem, cls, "__getitem__") < 0
+            || keep(&py_eq, cls, "__eq__") < 0
+            || keep(&py_ne, cls, "__ne__") < 0)
+        return NULL;
+    Py_INCREF(cache);
+    Py_INCREF(fct);
+    singles_cache = cache;
+    singles_fct = fct;
+    for (def = byt_methods; def->ml_name != NULL; def++) {
+        descr = PyDescr_NewMethod((PyTypeObject *)cls, def);
+        if (descr == NULL || PyObject_SetAttrString(cls, def->ml_name,
+                                                    descr) < 0) {
+            Py_XDECREF(descr);
+            return NULL;
+        }
+        Py_DECREF(descr);
+    }
+    fn = PyCFunction_New(&new_def, NULL);
+    if (fn == NULL)
+        return NULL;
+    static_new = PyStaticMethod_New(fn);
+    Py_DECREF(fn);
+    if (static_new == NULL
+            || PyObject_SetAttrString(cls, "__new__", static_new) < 0) {
+        Py_XDECREF(static_new);
+        return NULL;
+    }
+    Py_DECREF(static_new);
+    Py_INCREF(cls);
+    Byt = (PyTypeObject *)cls;
+    Py_RETURN_TRUE;
+}
+
+
+static PyMethodDef module_methods[] = {
+    {"install", install, METH_VARARGS,
+     "install(cls, singles, singles_fct)\n\n"
+     "Replaces the hottest methods of the Byt class cls by their compiled\n"
+     "versions; singles is the dict of the single-octet tables by class,\n"
+     "singles_fct builds a missing one. Returns whether cls is accelerated,\n"
+     "False if another class already was"},
+    {NULL, NULL}
+};
+
+
+static struct PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT,
+    "byt._speedups",
+    "Optional compiled accelerator of the hottest Byt methods",
+    -1,
+    module_methods
+};
+
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    if (PyType_Ready(&BytIterType) < 0)
+        return NULL;
+    return PyModule_Create(&module_def);
+}
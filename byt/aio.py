@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from collections import deque
+
+from .byt import Byt
+
+
+__all__ = ["BytReader", "BytFrames"]
+
+
+class BytReader(object):
+    """Adapter of an asyncio.StreamReader, returning Byt instances
+
+    The received buffers are directly turned into Byt (or cls) objects,
+    bypassing the type dispatch of Byt.__new__. Requires python 3.5+,
+    this module is not imported by the byt package.
+    """
+    def __init__(self, reader, cls=Byt):
+        self.reader = reader
+        self.cls = cls
+
+    def _wrap(self, data):
+        return bytes.__new__(self.cls, data)
+
+    def at_eof(self):
+        """
+        Returns whether the buffer is empty and the end of the stream
+        was reached
+        """
+        return self.reader.at_eof()
+
+    async def read(self, n=-1):
+        """
+        Reads up to n octets, or until the end of the stream if n is -1
+        """
+        return self._wrap(await self.reader.read(n))
+
+    async def readbyt(self, n):
+        """
+        Reads exactly n octets, raises asyncio.IncompleteReadError if
+        the end of the stream is reached before
+        """
+        return self._wrap(await self.reader.readexactly(n))
+
+    async def readuntil(self, separator=Byt('\n')):
+        """
+        Reads until the Byt separator is found, separator included
+        """
+        if not isinstance(separator, Byt):
+            raise TypeError("can't read until {}"\
+                    .format(type(separator).__name__))
+        return self._wrap(await self.reader.readuntil(separator))
+
+    async def readline(self):
+        """
+        Reads one line, terminated by a newline octet
+        """
+        return self._wrap(await self.reader.readline())
+
+    async def readframes(self, framer, n=65536):
+        """
+        Reads chunks of up to n octets into the framer until at least
+        one frame is complete, returns the list of completed frames;
+        the list is empty only at the end of the stream
+        """
+        while True:
+            chunk = await self.reader.read(n)
+            if not chunk:
+                return []
+            frames = framer._feed(chunk)
+            if frames:
+                return frames
+
+    def frames(self, framer, n=65536):
+        """
+        Returns the asynchronous iterator of the frames read by the
+        framer, in chunks of up to n octets
+        """
+        return BytFrames(self, framer, n)
+
+
+class BytFrames(object):
+    """Asynchronous iterator of the frames of a stream
+
+    Each read returns all the octets available, up to n, and all the
+    frames it completes are queued at once, so that frames are batched
+    when the producer is faster than the consumer.
+
+    >>> async def dump(reader):  # doctest: +SKIP
+    ...     async for frame in BytFrames(reader, DelimiterFramer(Byt(';'))):
+    ...         print(frame)
+    """
+    def __init__(self, reader, framer, n=65536):
+        if not isinstance(reader, BytReader):
+            reader = BytReader(reader, framer.cls)
+        self.reader = reader
+        self.framer = framer
+        self.n = n
+        self._queue = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._queue:
+            frames = await self.reader.readframes(self.framer, self.n)
+            if not frames:
+                raise StopAsyncIteration
+            self._queue.extend(frames)
+        return self._queue.popleft()
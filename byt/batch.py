@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from array import array
+from itertools import islice
+
+from .byt import Byt, PYTHON3, _hexlify
+
+try:
+    from itertools import accumulate
+except ImportError:  # python2
+    accumulate = None
+
+
+__all__ = ["Packed", "pack", "hex", "equal", "find", "sort"]
+
+
+# typecode of the offsets arrays
+_OFFSETS = 'Q' if PYTHON3 else 'L'
+
+
+def _check(values, name):
+    """
+    Returns the list of the Byt records of a batch, validating their
+    types once for the whole batch
+    """
+    if isinstance(values, Packed):
+        return values.byts()
+    if not isinstance(values, list):
+        values = list(values)
+    for tp in set(map(type, values)):
+        if not issubclass(tp, Byt):
+            raise TypeError("can't {} a batch of {}"\
+                    .format(name, tp.__name__))
+    return values
+
+
+def _spans(offsets):
+    """
+    Returns the iterator of the (start, stop) pairs of an offsets array
+    """
+    return zip(offsets, islice(offsets, 1, None))
+
+
+class Packed(object):
+    """Batch of Byt records packed in one contiguous Byt buffer,
+    delimited by an array of len(records) + 1 offsets
+
+    Records are given as zero-copy BytView by indexing and iteration,
+    or as Byt by byts.
+
+    >>> p = pack([Byt('ab'), Byt(), Byt('cde')])
+    >>> len(p)
+    3
+    >>> p[2]
+    BytView(Byt('cde'))
+    >>> p.offsets.tolist()
+    [0, 2, 2, 5]
+    """
+    __slots__ = ('buffer', 'offsets')
+
+    def __init__(self, buffer, offsets):
+        if not isinstance(buffer, Byt):
+            raise TypeError("can't pack {}".format(type(buffer).__name__))
+        self.buffer = buffer
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("index out of range")
+        return self.buffer.view(self.offsets[i], self.offsets[i + 1])
+
+    def __iter__(self):
+        buffer = self.buffer
+        return (buffer.view(start, stop)
+                for start, stop in _spans(self.offsets))
+
+    def byts(self):
+        """
+        Returns the list of the records, as Byt
+        """
+        buffer = self.buffer
+        return [buffer[start:stop] for start, stop in _spans(self.offsets)]
+
+    def __repr__(self):
+        return "{}({} records, {} octets)".format(
+            self.__class__.__name__, len(self), len(self.buffer))
+
+
+def pack(values):
+    """
+    Returns the Packed batch of an iterable of Byt records, joined in
+    one pass; the buffer is of the class of the first record
+    """
+    if isinstance(values, Packed):
+        return values
+    values = _check(values, 'pack')
+    cls = type(values[0]) if values else Byt
+    buffer = cls(bytes().join(values))
+    if accumulate is not None:
+        offsets = array(_OFFSETS, [0])
+        offsets.extend(accumulate(map(len, values)))
+    else:
+        offsets, pos = array(_OFFSETS, [0]), 0
+        for value in values:
+            pos += len(value)
+            offsets.append(pos)
+    return Packed(buffer, offsets)
+
+
+def hex(values, sep=' ', group=1, upper=False):
+    """
+    Returns the list of the hexadecimal representations of a batch, as
+    Byt.hex would give them; the batch is hexlified in one pass unless
+    octets are grouped
+
+    >>> hex([Byt('ab'), Byt('c')])
+    ['61 62', '63']
+    """
+    packed = pack(values)
+    buffer, offsets = packed.buffer, packed.offsets
+    if not sep or group <= 0:
+        res, width, tail = _hexlify(buffer, '', 0, upper), 2, 0
+    elif group == 1:
+        res = _hexlify(buffer, sep, 1, upper)
+        width, tail = 2 + len(sep), len(sep)
+    else:
+        return [_hexlify(buffer[start:stop], sep, group, upper)
+                for start, stop in _spans(offsets)]
+    return [res[width * start:width * stop - tail]
+            for start, stop in _spans(offsets)]
+
+
+def equal(values, others):
+    """
+    Returns the list of the element-wise equalities of two batches of
+    same length, or of a batch and a single Byt reference
+
+    >>> equal([Byt('ab'), Byt('c')], Byt('c'))
+    [False, True]
+    """
+    values = _check(values, 'compare')
+    if isinstance(others, Byt):
+        eq = bytes.__eq__
+        return [eq(value, others) for value in values]
+    others = _check(others, 'compare')
+    if len(values) != len(others):
+        raise ValueError("can't compare batches of different lengths")
+    eq = bytes.__eq__
+    return [eq(value, other) for value, other in zip(values, others)]
+
+
+def find(values, sub):
+    """
+    Returns the list of the lowest indexes of sub in each record of a
+    batch, -1 where it is not found; a Packed batch is searched in
+    place
+
+    >>> find([Byt('abc'), Byt('cab'), Byt('c')], Byt('ab'))
+    [0, 1, -1]
+    """
+    if not isinstance(sub, Byt):
+        raise TypeError("can't find {} in a batch of Byt"\
+                .format(type(sub).__name__))
+    if not isinstance(values, Packed):
+        search = bytes.find
+        return [search(value, sub) for value in _check(values, 'find')]
+    search = values.buffer.find
+    res = []
+    for start, stop in _spans(values.offsets):
+        pos = search(sub, start, stop)
+        res.append(pos - start if pos >= 0 else -1)
+    return res
+
+
+def sort(values, key=None, reverse=False):
+    """
+    Returns the sorted list of the records of a batch; key may be a
+    function, or a slice of the records to sort by, compared without
+    building intermediate Byt
+
+    >>> sort([Byt('b1'), Byt('a2'), Byt('c0')], key=slice(1, 2))
+    [Byt('c0'), Byt('b1'), Byt('a2')]
+    """
+    values = _check(values, 'sort')
+    if isinstance(key, slice):
+        getitem = bytes.__getitem__
+        keys = [getitem(value, key) for value in values]
+        order = sorted(range(len(values)), key=keys.__getitem__,
+                       reverse=reverse)
+        return [values[i] for i in order]
+    return sorted(values, key=key, reverse=reverse)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from argparse import ArgumentParser
+from binascii import hexlify
+from itertools import repeat
+from json import dump
+from platform import python_implementation
+from platform import python_version
+import sys
+from timeit import default_timer
+
+from ..byt import Byt, __version__
+
+
+__all__ = ["SIZES", "OPERATIONS", "run", "main"]
+
+
+# input sizes in octets, from 1 B to 100 MB
+SIZES = (1, 100, 10 ** 4, 10 ** 6, 10 ** 8)
+
+# benchmarked operations, in report order
+OPERATIONS = ("new", "getitem", "slice", "iter", "contains", "find", "eq",
+              "add", "hex", "split", "join")
+
+# repeated to build the inputs, split and join on the newlines
+_PATTERN = b'GET /index.html\n'
+
+
+def _data(size):
+    """
+    Returns size octets of the repeated pattern, as bytes
+    """
+    return (_PATTERN * (size // len(_PATTERN) + 1))[:size]
+
+
+def _iterate(value):
+    for _ in value:
+        pass
+
+
+def _cases(raw):
+    """
+    Returns the dict of the (Byt, bytes) pairs of callables of each
+    operation over the octets raw
+    """
+    b, b2 = Byt(raw), Byt(bytearray(raw))
+    raw2 = bytes(bytearray(raw))
+    buf = bytearray(raw)
+    mid = len(raw) // 2
+    sep, bsep = b'\n', Byt('\n')
+    parts, bparts = raw.split(sep), b.split(bsep)
+    # absent from the pattern, membership scans all octets
+    absent, babsent = b'\xff', Byt('\xff')
+    return {
+        "new": (lambda: Byt(buf), lambda: bytes(buf)),
+        "getitem": (lambda: b[mid], lambda: raw[mid]),
+        "slice": (lambda: b[1:mid], lambda: raw[1:mid]),
+        "iter": (lambda: _iterate(b), lambda: _iterate(raw)),
+        "contains": (lambda: babsent in b, lambda: absent in raw),
+        "find": (lambda: b.find(babsent), lambda: raw.find(absent)),
+        "eq": (lambda: b == b2, lambda: raw == raw2),
+        "add": (lambda: b + b2, lambda: raw + raw2),
+        "hex": (lambda: b.hex(''), lambda: hexlify(raw)),
+        "split": (lambda: b.split(bsep), lambda: raw.split(sep)),
+        "join": (lambda: bsep.join(bparts), lambda: sep.join(parts)),
+    }
+
+
+def _time(fct, repeat_=3, mintime=0.1):
+    """
+    Returns the best time per call of fct in seconds, over repeat_
+    loops of at least mintime seconds each
+    """
+    number = 1
+    while True:
+        start = default_timer()
+        for _ in repeat(None, number):
+            fct()
+        best = default_timer() - start
+        if best >= mintime:
+            break
+        number *= 10
+    for _ in range(repeat_ - 1):
+        start = default_timer()
+        for _ in repeat(None, number):
+            fct()
+        best = min(best, default_timer() - start)
+    return best / number
+
+
+def run(sizes=SIZES, operations=OPERATIONS, repeat=3, mintime=0.1):
+    """
+    Returns the benchmark report of the operations over each input
+    size, as a JSON-serializable dict; each result gives the time per
+    call in seconds for Byt and bytes, and their ratio (the Byt
+    overhead)
+    """
+    for op in operations:
+        if op not in OPERATIONS:
+            raise ValueError("unknown operation '{}'".format(op))
+    results = []
+    for size in sizes:
+        cases = _cases(_data(size))
+        for op in operations:
+            byt_fct, bytes_fct = cases[op]
+            byt_time = _time(byt_fct, repeat, mintime)
+            bytes_time = _time(bytes_fct, repeat, mintime)
+            results.append({
+                "operation": op,
+                "size": size,
+                "byt": byt_time,
+                "bytes": bytes_time,
+                "ratio": byt_time / bytes_time if bytes_time > 0 else None})
+    return {"byt": __version__,
+            "python": "{} {}".format(python_implementation(),
+                                     python_version()),
+            "results": results}
+
+
+def _table(report):
+    """
+    Returns the lines of the text table of a report
+    """
+    yield "{:<10}{:>12}{:>14}{:>14}{:>9}".format(
+        "operation", "size", "Byt (us)", "bytes (us)", "ratio")
+    for res in report["results"]:
+        ratio = "-" if res["ratio"] is None\
+                    else "{:.2f}".format(res["ratio"])
+        yield "{:<10}{:>12}{:>14.3f}{:>14.3f}{:>9}".format(
+            res["operation"], res["size"], res["byt"] * 1e6,
+            res["bytes"] * 1e6, ratio)
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line, prints the table and
+    optionally writes the JSON report
+    """
+    parser = ArgumentParser(prog="python -m byt.bench",
+                            description="Byt overhead against bytes")
+    parser.add_argument("--sizes", type=lambda s: [int(i) for i in
+                                                   s.split(',')],
+                        default=SIZES,
+                        help="comma-separated input sizes in octets")
+    parser.add_argument("--operations", type=lambda s: s.split(','),
+                        default=OPERATIONS,
+                        help="comma-separated operations, among: {}"\
+                                .format(', '.join(OPERATIONS)))
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timing loops, the best is kept")
+    parser.add_argument("--mintime", type=float, default=0.1,
+                        help="minimum duration of a timing loop, seconds")
+    parser.add_argument("--json", metavar="PATH",
+                        help="writes the JSON report to PATH, - for stdout")
+    args = parser.parse_args(argv)
+    report = run(args.sizes, args.operations, args.repeat, args.mintime)
+    if args.json == '-':
+        dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return report
+    for line in _table(report):
+        print(line)
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            dump(report, f, indent=2)
+    return report
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from struct import Struct
+
+from .byt import Byt, BytView, PYTHON3
+
+
+__all__ = ["BitReader", "BitWriter"]
+
+
+_WORD = {'msb': Struct('>Q'), 'lsb': Struct('<Q')}
+
+
+class BitReader(object):
+    """Bit-level reader over a Byt or BytView
+
+    Bits are read most significant first (order='msb') or least
+    significant first (order='lsb') within each octet. Octets are loaded
+    8 at a time into an integer cache, from which the bit fields are
+    extracted with shifts and masks.
+
+    >>> r = BitReader(Byt(0b10110010, 0xff))
+    >>> r.read(3), r.read(5), r.readSigned(4)
+    (5, 18, -1)
+    """
+    def __init__(self, value, order='msb'):
+        if isinstance(value, BytView):
+            value = value.memview() if PYTHON3 else value.memview().tobytes()
+        elif not isinstance(value, Byt):
+            raise TypeError("can't read bits of {}"\
+                    .format(type(value).__name__))
+        if order not in _WORD:
+            raise ValueError("order must be 'msb' or 'lsb'")
+        self.order = order
+        self._buf = value
+        self._word = _WORD[order]
+        self._pos = 0
+        self._cache = 0
+        self._nbits = 0
+
+    def tell(self):
+        """
+        Returns the position of the next bit to be read
+        """
+        return self._pos * 8 - self._nbits
+
+    def remaining(self):
+        """
+        Returns the number of bits left
+        """
+        return len(self._buf) * 8 - self.tell()
+
+    def _fill(self, nbits):
+        """
+        Loads octets into the cache until it holds at least nbits bits
+        """
+        buf = self._buf
+        while self._nbits < nbits:
+            if self._pos + 8 <= len(buf):
+                word, = self._word.unpack_from(buf, self._pos)
+                size = 64
+            elif self._pos < len(buf):
+                word = bytearray(buf[self._pos:self._pos + 1])[0]
+                size = 8
+            else:
+                raise EOFError("can't read {} bits, {} left"\
+                        .format(nbits, self._nbits))
+            if self.order == 'msb':
+                self._cache = (self._cache << size) | word
+            else:
+                self._cache |= word << self._nbits
+            self._nbits += size
+            self._pos += size // 8
+
+    def peek(self, nbits):
+        """
+        Returns the unsigned integer of the next nbits bits, without
+        consuming them
+        """
+        if nbits > self._nbits:
+            self._fill(nbits)
+        if self.order == 'msb':
+            return self._cache >> (self._nbits - nbits)
+        return self._cache & ((1 << nbits) - 1)
+
+    def read(self, nbits):
+        """
+        Reads the next nbits bits as an unsigned integer
+        """
+        res = self.peek(nbits)
+        self._nbits -= nbits
+        if self.order == 'msb':
+            self._cache &= (1 << self._nbits) - 1
+        else:
+            self._cache >>= nbits
+        return res
+
+    def readSigned(self, nbits):
+        """
+        Reads the next nbits bits as a two's complement signed integer
+        """
+        res = self.read(nbits)
+        if nbits and res >> (nbits - 1):
+            res -= 1 << nbits
+        return res
+
+    def readByt(self, size):
+        """
+        Reads the next size octets as a Byt
+        """
+        return Byt([self.read(8) for _ in range(size)]) \
+            if self.tell() % 8 else self._readAligned(size)
+
+    def _readAligned(self, size):
+        start = self.tell() // 8
+        if start + size > len(self._buf):
+            raise EOFError("can't read {} octets".format(size))
+        self.skip(8 * size)
+        return Byt(self._buf[start:start + size])
+
+    def skip(self, nbits):
+        """
+        Skips the next nbits bits
+        """
+        if nbits <= self._nbits:
+            self.read(nbits)
+            return
+        target = self.tell() + nbits
+        if target > len(self._buf) * 8:
+            raise EOFError("can't skip {} bits".format(nbits))
+        self._pos = target // 8
+        self._cache = 0
+        self._nbits = 0
+        self.read(target % 8)
+
+    def align(self):
+        """
+        Skips the bits up to the next octet boundary
+        """
+        self.skip(-self.tell() % 8)
+
+
+class BitWriter(object):
+    """Bit-level writer, producing a Byt
+
+    Bits are written most significant first (order='msb') or least
+    significant first (order='lsb') within each octet, and are
+    accumulated in an integer, flushed 8 octets at a time.
+
+    >>> w = BitWriter()
+    >>> w.write(5, 3)
+    >>> w.write(18, 5)
+    >>> w.writeSigned(-1, 4)
+    >>> w.byt().hex()
+    'b2 f0'
+    """
+    def __init__(self, order='msb'):
+        if order not in _WORD:
+            raise ValueError("order must be 'msb' or 'lsb'")
+        self.order = order
+        self._word = _WORD[order]
+        self._out = bytearray()
+        self._acc = 0
+        self._nbits = 0
+
+    def tell(self):
+        """
+        Returns the number of bits written
+        """
+        return len(self._out) * 8 + self._nbits
+
+    def write(self, value, nbits):
+        """
+        Writes an unsigned integer on nbits bits
+        """
+        if value < 0 or value >> nbits:
+            raise ValueError("{} doesn't fit in {} unsigned bits"\
+                    .format(value, nbits))
+        if self.order == 'msb':
+            self._acc = (self._acc << nbits) | value
+        else:
+            self._acc |= value << self._nbits
+        self._nbits += nbits
+        while self._nbits >= 64:
+            self._nbits -= 64
+            if self.order == 'msb':
+                self._out += self._word.pack(self._acc >> self._nbits)
+                self._acc &= (1 << self._nbits) - 1
+            else:
+                self._out += self._word.pack(self._acc & 0xffffffffffffffff)
+                self._acc >>= 64
+
+    def writeSigned(self, value, nbits):
+        """
+        Writes a two's complement signed integer on nbits bits
+        """
+        if not -(1 << (nbits - 1)) <= value < (1 << (nbits - 1)):
+            raise ValueError("{} doesn't fit in {} signed bits"\
+                    .format(value, nbits))
+        self.write(value & ((1 << nbits) - 1), nbits)
+
+    def writeByt(self, value):
+        """
+        Writes the octets of a Byt
+        """
+        if not isinstance(value, Byt):
+            raise TypeError("can't write {}".format(type(value).__name__))
+        if self._nbits % 8:
+            for c in value.iterInts():
+                self.write(c, 8)
+            return
+        # aligned: flushes the pending octets, then copies in bulk
+        self._out.extend(self._tail())
+        self._out.extend(value)
+        self._acc = 0
+        self._nbits = 0
+
+    def align(self):
+        """
+        Pads with zero bits up to the next octet boundary
+        """
+        self.write(0, -self._nbits % 8)
+
+    def _tail(self):
+        """
+        Returns the octets of the pending bits, the last one being
+        padded with zero bits
+        """
+        pad = -self._nbits % 8
+        size = (self._nbits + pad) // 8
+        if self.order == 'msb':
+            return bytearray((self._acc << pad) >> shift & 0xff
+                             for shift in range(8 * size - 8, -8, -8))
+        return bytearray(self._acc >> shift & 0xff
+                         for shift in range(0, 8 * size, 8))
+
+    def byt(self):
+        """
+        Returns the bits written as a Byt, the last octet being padded
+        with zero bits
+        """
+        return Byt.frombuffer(self._out + self._tail())
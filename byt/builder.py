@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from .byt import Byt, DByt, BytView, PYTHON3
+
+
+__all__ = ["BytBuilder"]
+
+
+class BytBuilder(object):
+    """Mutable bytes-chain accumulator, finalized into a Byt or DByt
+
+    Octets are written into a pre-allocated bytearray which grows
+    geometrically, so that building a bytes-chain piece by piece costs
+    linear time instead of the quadratic repeated Byt concatenation.
+    It only accepts Byt (or BytView) inputs, and integers when appending.
+
+    >>> b = BytBuilder()
+    >>> b += Byt('ab')
+    >>> b.append(99)
+    >>> b.byt()
+    Byt('abc')
+    """
+    __slots__ = ('_buf', '_len')
+
+    def __init__(self, capacity=0):
+        self._buf = bytearray(capacity)
+        self._len = 0
+
+    @property
+    def capacity(self):
+        """
+        Number of octets that can be held without re-allocation
+        """
+        return len(self._buf)
+
+    def reserve(self, capacity):
+        """
+        Makes sure that at least capacity octets can be held without
+        re-allocation
+        """
+        if capacity > len(self._buf):
+            self._buf.extend(bytearray(capacity - len(self._buf)))
+
+    def _grow(self, n):
+        need = self._len + n
+        if need > len(self._buf):
+            self.reserve(max(need, 2 * len(self._buf)))
+
+    def __len__(self):
+        return self._len
+
+    def write(self, value):
+        """
+        Writes a Byt at the end of the builder, returns the number of
+        octets written
+        """
+        if isinstance(value, BytView):
+            value = value.memview()
+        elif not isinstance(value, Byt):
+            raise TypeError("can't write {} to {}"\
+                    .format(type(value).__name__, type(self).__name__))
+        n = len(value)
+        self._grow(n)
+        self._buf[self._len:self._len + n] = value
+        self._len += n
+        return n
+
+    def append(self, value):
+        """
+        Appends an integer-code or a Byt at the end of the builder
+        """
+        if isinstance(value, int):
+            self._grow(1)
+            self._buf[self._len] = value
+            self._len += 1
+        else:
+            self.write(value)
+
+    def extend(self, iterable):
+        """
+        Appends all integer-codes or Byt of the iterable
+        """
+        for item in iterable:
+            self.append(item)
+
+    def __iadd__(self, value):
+        self.write(value)
+        return self
+
+    def clear(self):
+        """
+        Empties the builder, keeping its capacity
+        """
+        self._len = 0
+
+    def _payload(self):
+        if PYTHON3:
+            return memoryview(self._buf)[:self._len]
+        return str(self._buf[:self._len])
+
+    def byt(self):
+        """
+        Returns the content as a Byt instance
+        """
+        return Byt(self._payload())
+
+    def dbyt(self):
+        """
+        Returns the content as a DByt instance
+        """
+        return DByt(self._payload())
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, repr(self.byt()))
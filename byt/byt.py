@@ -25,14 +25,33 @@
 ###############################################################################
 
 
+from array import array
 from binascii import hexlify
 from binascii import unhexlify
+from collections import OrderedDict
+from mmap import ACCESS_READ
+from mmap import mmap as memorymap
+from operator import and_
+from operator import or_
+from operator import xor
+from os import environ
+from re import compile as re_compile
+from re import escape as re_escape
+from struct import Struct
+from struct import error as StructError
+try:
+    from pickle import PickleBuffer
+except ImportError:  # python < 3.8
+    PickleBuffer = None
 from sys import version_info
 PYTHON3 = version_info > (3,)
+# memoryview.hex accepts a separator from python 3.8
+HEXSEP = version_info >= (3, 8)
 
 
-__all__ = ["Byt", "DByt", "__version__", "__major__", "__minor__", "__micro__",
-           "__author__", "__copyright__", "__contributors__"]
+__all__ = ["Byt", "DByt", "BytView", "setInternCache", "__version__",
+           "__major__", "__minor__", "__micro__", "__author__",
+           "__copyright__", "__contributors__"]
 __version__ = "1.1.0"
 __major__, __minor__, __micro__ = list(map(int, __version__.split('.')))
 __author__ = "Guillaume Schworer (guillaume.schworer@gmail.com)"
@@ -42,8 +61,248 @@ __contributors__ = [
 ]
 
 
+# 0x prefixes and whitespaces tolerated by fromHex
+_HEXJUNK = re_compile(r'(?<![0-9a-fA-F])0[xX]|\s+')
+
+
+def _hexlify(value, sep=' ', group=1, upper=False):
+    """
+    Returns the hexadecimal representation of any buffer in one pass,
+    with a separator every group octets
+    """
+    # the case applies to the digits only, not to a letter separator
+    if HEXSEP and group > 0 and len(sep) == 1 and ord(sep) < 128 \
+            and not (upper and sep.isalpha()):
+        res = memoryview(value).hex(sep, -group)
+        return res.upper() if upper else res
+    res = hexlify(value)
+    if upper:
+        res = res.upper()
+    if PYTHON3:
+        res = res.decode('ascii')
+    if sep and group > 0:
+        step = 2 * group
+        res = sep.join([res[i:i+step] for i in range(0, len(res), step)])
+    return res
+
+
+# printable ASCII octets are kept in the hexdump gutter, others show as '.'
+_GUTTER = bytes(bytearray(c if 32 <= c < 127 else 46 for c in range(256)))
+
+
+def _hexdump(value, width=16, group=2, offset=0, length=None):
+    """
+    Generates the xxd-like lines of any buffer, one line at a time
+    """
+    mv = memoryview(value)
+    stop = len(mv) if length is None else min(len(mv), offset + length)
+    span = 2 * width + ((width - 1) // group if group > 0 else 0)
+    for pos in range(offset, stop, width):
+        chunk = mv[pos:min(pos + width, stop)]
+        gutter = chunk.tobytes().translate(_GUTTER)
+        if PYTHON3:
+            gutter = gutter.decode('ascii')
+        yield "{:08x}: {}  {}".format(
+            pos, _hexlify(chunk, ' ', group).ljust(span), gutter)
+
+
+# compiled struct formats, least recently used first
+_STRUCTS = OrderedDict()
+_STRUCTS_MAXSIZE = 256
+
+
+def _struct(fmt):
+    """
+    Returns the compiled Struct of a format, from a bounded LRU cache
+    """
+    try:
+        st = _STRUCTS.pop(fmt)
+    except KeyError:
+        st = Struct(fmt)
+        if len(_STRUCTS) >= _STRUCTS_MAXSIZE:
+            _STRUCTS.popitem(last=False)
+    _STRUCTS[fmt] = st
+    return st
+
+
+def _iter_unpack(fmt, value, offset=0):
+    """
+    Returns the iterator of the tuples of consecutive fmt records of any
+    buffer, from offset
+    """
+    st = _struct(fmt)
+    if PYTHON3:
+        return st.iter_unpack(memoryview(value)[offset:])
+    length = len(value) - offset
+    if st.size == 0 or length % st.size != 0:
+        raise StructError("iterative unpacking requires a buffer of a "
+                          "multiple of {} bytes".format(st.size))
+    return (st.unpack_from(value, pos)
+            for pos in range(offset, offset + length, st.size))
+
+
+# octets complemented, for bitwise inversion
+_INVERT = bytes(bytearray(255 - c for c in range(256)))
+
+
+def _toint(value):
+    """
+    Returns the big-endian integer of any buffer
+    """
+    if PYTHON3:
+        return int.from_bytes(value, 'big')
+    return int(hexlify(value), 16) if len(value) else 0
+
+
+def _fromint(cls, number, length):
+    """
+    Returns the cls instance of length octets of a big-endian integer
+    """
+    if length == 0:
+        return cls()
+    if PYTHON3:
+        return cls(number.to_bytes(length, 'big'))
+    return cls(unhexlify('{:0{}x}'.format(number, 2 * length)))
+
+
+def _bitwise(value, other, op, name):
+    """
+    Returns the bitwise op of two Byt of same length, computed in bulk
+    as integers
+    """
+    if not isinstance(other, Byt):
+        raise TypeError("can't {} {} and {}"\
+                .format(name, type(value).__name__, type(other).__name__))
+    if len(other) != len(value):
+        raise ValueError("can't {} bytes-chains of different lengths"\
+                .format(name))
+    return _fromint(type(value), op(_toint(value), _toint(other)),
+                    len(value))
+
+
+def _unhexlify(hexes):
+    """
+    Returns the octets of a hexadecimal string, ignoring whitespaces
+    and 0x prefixes
+    """
+    if PYTHON3:
+        try:
+            # fast path, skips whitespaces natively
+            return bytes.fromhex(hexes)
+        except ValueError:
+            pass
+    return unhexlify(_HEXJUNK.sub('', hexes))
+
+
+# single-octet instances of each class, built on first use
+_SINGLES = {}
+
+
+def _singles(cls):
+    """
+    Returns the table of the 256 shared single-octet cls instances,
+    indexed by integer-code
+    """
+    try:
+        return _SINGLES[cls]
+    except KeyError:
+        table = _SINGLES[cls] = [bytes.__new__(cls, bytes(bytearray((c,))))
+                                 for c in range(256)]
+        return table
+
+
+def _single(cls, code):
+    """
+    Returns the shared single-octet cls instance of an integer
+    """
+    if not 0 <= code < 256:
+        raise ValueError("byte must be in range(0, 256)")
+    return _singles(cls)[code]
+
+
+def _unpickle(cls, data):
+    """
+    Returns the cls instance of pickled data, copied once from the bytes
+    or the out-of-band buffer given by the unpickler
+    """
+    return bytes.__new__(cls, data)
+
+
+def _rope():
+    """
+    Returns the BytRope class, imported late as the rope module imports
+    this one
+    """
+    from .rope import BytRope
+    return BytRope
+
+
+# short bytes-chains interned, least recently used first, disabled
+# until setInternCache is called
+_INTERNED = OrderedDict()
+_INTERN_MAXSIZE = 0
+_INTERN_MAXLENGTH = 8
+
+
+def setInternCache(maxsize=256, maxlength=8):
+    """
+    Enables the bounded LRU intern of the bytes-chains of up to
+    maxlength octets, shared by Byt.intern, split and rsplit;
+    maxsize=0 disables and clears it. Single octets are always shared
+    """
+    global _INTERN_MAXSIZE, _INTERN_MAXLENGTH
+    if maxsize < 0 or maxlength < 0:
+        raise ValueError("maxsize and maxlength can't be negative")
+    _INTERN_MAXSIZE, _INTERN_MAXLENGTH = maxsize, maxlength
+    _INTERNED.clear()
+
+
+def _intern(cls, value):
+    """
+    Returns the shared cls instance of a short buffer, or a new one if
+    it is too long or the intern is disabled
+    """
+    n = len(value)
+    if n == 1:
+        return _singles(cls)[ord(value[:1])]
+    if n > _INTERN_MAXLENGTH or not _INTERN_MAXSIZE:
+        return cls(value)
+    key = (cls, memoryview(value).tobytes())
+    try:
+        res = _INTERNED.pop(key)
+    except KeyError:
+        res = value if type(value) is cls else cls(key[1])
+        if len(_INTERNED) >= _INTERN_MAXSIZE:
+            _INTERNED.popitem(last=False)
+    _INTERNED[key] = res
+    return res
+
+
+def _split(cls, parts):
+    """
+    Returns the list of the cls instances of split parts, interned
+    """
+    if _INTERN_MAXSIZE:
+        return [_intern(cls, part) for part in parts]
+    table = _singles(cls)
+    return [table[ord(part)] if len(part) == 1 else cls(part)
+            for part in parts]
+
+
 if PYTHON3:
 
+    def _new_latin1(cls, value):
+        """
+        Returns the cls instance of a unicode, forced to latin-1
+        """
+        return bytes.__new__(cls, value.encode('ISO-8859-1'))
+
+    # constructors by exact input type, others go through isinstance
+    _NEW = {bytes: bytes.__new__, bytearray: bytes.__new__,
+            memoryview: bytes.__new__, array: bytes.__new__,
+            list: bytes.__new__, tuple: bytes.__new__,
+            str: _new_latin1, int: _single}
+
     class Byt(bytes):
         """Python version-independent bytes-chains object, displayed as bytes
 
@@ -52,6 +311,15 @@ if PYTHON3:
         Byt('!"#$')
         >>> str(b)
         '!"#$'
+
+        Construction cost, by input type:
+
+        * Byt of the same class: free, the object itself is returned
+        * int: free, one of the 256 shared single-octet instances
+        * Byt of another class, bytes, bytearray, memoryview, array,
+          BytView: one copy
+        * str: one latin-1 encoding and one copy
+        * list, tuple or generator of ints: one pass over the items
         """
         def __new__(cls, *args):
             l = len(args)
@@ -60,24 +328,71 @@ if PYTHON3:
             elif l == 1:  # one arg
                 value = args[0]
             else:  # empty input
-                value = ''
-            if isinstance(value, Byt):
-                value = value.str().encode('ISO-8859-1')
+                return super().__new__(cls)
+            tp = type(value)
+            if tp is cls:
+                # immutable, share it
+                return value
+            new = _NEW.get(tp)
+            if new is not None:
+                return new(cls, value)
+            if isinstance(value, BytView):
+                value = value.memview()
             elif isinstance(value, str):
                 # It's a unicode, force ascii/latin-1 encoding
                 value = value.encode('ISO-8859-1')
             elif isinstance(value, int):
-                value = chr(value).encode('ISO-8859-1')
+                return _single(cls, value)
+            # Byt of another class share the buffer protocol of bytes
             return super().__new__(cls, value)
 
+        @classmethod
+        def frombuffer(cls, buf):
+            """
+            Returns a bytes-chain copied in one pass from any object
+            supporting the buffer protocol: bytes, bytearray, memoryview,
+            array, mmap, numpy arrays
+
+            >>> Byt.frombuffer(bytearray([104, 105]))
+            Byt('hi')
+            """
+            return super().__new__(cls, memoryview(buf))
+
+        @classmethod
+        def fromints(cls, ints):
+            """
+            Returns a bytes-chain from integers in range(0, 256), copied
+            in one pass from an array('B'), iterated otherwise
+
+            >>> Byt.fromints(array('B', [104, 105]))
+            Byt('hi')
+            """
+            if isinstance(ints, array) and ints.typecode != 'B':
+                ints = ints.tolist()
+            return super().__new__(cls, ints)
+
         def __getitem__(self, pos):
-            return type(self)(super().__getitem__(pos))
+            res = super().__getitem__(pos)
+            if type(res) is int:
+                return _singles(type(self))[res]
+            return type(self)(res)
+
+        def view(self, start=None, stop=None):
+            """
+            Returns a zero-copy BytView of the octets between start
+            and stop, sharing the memory of the bytes-chain
+            """
+            return BytView(self, start, stop)
 
         def __eq__(self, other):
             if not isinstance(other, Byt):
-                if isinstance(other, (str, bytes)):
+                if isinstance(other, BytView):
+                    return other.__eq__(self)
+                elif isinstance(other, (str, bytes)):
                     raise TypeError("can't compare {} and {}"\
                             .format(type(self).__name__, type(other).__name__))
+                elif isinstance(other, _rope()):
+                    return other.__eq__(self)
                 else:
                     return False
             else:
@@ -87,20 +402,56 @@ if PYTHON3:
         def fromHex(cls, hexes):
             """
             Creates a Byt instance from a, e.g., '12 ab 34 cd' string,
-            equivalent to Byt.hex() method output
+            equivalent to Byt.hex() method output. Whitespaces, newlines
+            and 0x prefixes are ignored
+            """
+            return cls(_unhexlify(hexes))
+
+        @classmethod
+        def fromFile(cls, path, offset=0, length=None):
+            """
+            Creates a Byt instance from the content of a file, reading
+            only length octets from offset if provided
+            """
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                return cls(f.read(-1 if length is None else length))
+
+        @classmethod
+        def mmap(cls, path, offset=0, length=None):
             """
-            return cls(unhexlify(hexes.replace(" ", "")))
+            Returns a read-only BytView of a memory-mapped file, or of
+            its length octets from offset if provided; the file content
+            is loaded lazily by the operating system
+            """
+            stop = None if length is None else offset + length
+            with open(path, 'rb') as f:
+                try:
+                    mm = memorymap(f.fileno(), 0, access=ACCESS_READ)
+                except ValueError:  # empty files can't be mapped
+                    return BytView(cls(), offset, stop)
+            return BytView(mm, offset, stop, cls)
 
         def __ne__(self, other):
             if not isinstance(other, Byt):
-                if isinstance(other, (str, bytes)):
+                if isinstance(other, BytView):
+                    return other.__ne__(self)
+                elif isinstance(other, (str, bytes)):
                     raise TypeError("can't compare {} and {}"\
                         .format(type(self).__name__, type(other).__name__))
+                elif isinstance(other, _rope()):
+                    return other.__ne__(self)
                 else:
                     return True
             else:
                 return super().__ne__(other)
 
+        def __reduce_ex__(self, protocol):
+            if protocol >= 5 and PickleBuffer is not None:
+                # out-of-band capable, no copy into the pickle stream
+                return _unpickle, (type(self), PickleBuffer(self))
+            return _unpickle, (type(self), bytes(self))
+
         def __str__(self):
             return self.decode('ISO-8859-1')
 
@@ -118,11 +469,12 @@ if PYTHON3:
                                    repr(self.str()))
 
         def __iter__(self):
-            for ch in super().__iter__():
-                yield type(self)(ch)
+            return map(_singles(type(self)).__getitem__, super().__iter__())
 
         def __add__(self, txt):
             if not isinstance(txt, Byt):
+                if isinstance(txt, _rope()):
+                    return txt.__radd__(self)
                 raise TypeError("can't concat {} to {}"\
                         .format(type(self).__name__, type(txt).__name__))
             return type(self)(super().__add__(txt))
@@ -139,46 +491,154 @@ if PYTHON3:
         def __rmul__(self, other):
             return type(self)(super().__rmul__(other))
 
+        def __xor__(self, other):
+            return _bitwise(self, other, xor, 'xor')
+
+        def __and__(self, other):
+            return _bitwise(self, other, and_, 'and')
+
+        def __or__(self, other):
+            return _bitwise(self, other, or_, 'or')
+
+        def __invert__(self):
+            return type(self)(super().translate(_INVERT))
+
+        def __lshift__(self, n):
+            mask = (1 << 8 * len(self)) - 1
+            return _fromint(type(self), (_toint(self) << n) & mask, len(self))
+
+        def __rshift__(self, n):
+            return _fromint(type(self), _toint(self) >> n, len(self))
+
+        def xorKey(self, key):
+            """
+            Returns the bitwise xor of the bytes-chain with the Byt key,
+            repeated over its length
+            """
+            if not isinstance(key, Byt):
+                raise TypeError("can't xor {} with {}"\
+                        .format(type(self).__name__, type(key).__name__))
+            if len(key) == 0:
+                raise ValueError("empty key")
+            stream = key * (len(self) // len(key) + 1)
+            # drops the trailing octets of the repeated key
+            stream = _toint(stream) >> 8 * (len(stream) - len(self))
+            return _fromint(type(self), _toint(self) ^ stream, len(self))
+
         def __contains__(self, other):
             if not isinstance(other, Byt):
                 if not isinstance(other, int):
                     raise TypeError("can't compare {} to {}"\
                             .format(type(self).__name__, type(other).__name__))
+                elif not 0 <= other < 256:
+                    return False
                 else:
-                    return other in self.ints()
+                    return super().__contains__(other)
             else:
                 return super().__contains__(other)
 
+        def byteset(self):
+            """
+            Returns the frozenset of the ASCII integers-codes present in
+            the bytes-chain, computed once and cached
+            """
+            try:
+                return self._byteset
+            except AttributeError:
+                self._byteset = frozenset(self.iterInts())
+                return self._byteset
+
         def iterInts(self):
             """
             Returns the iterator of ASCII integers-codes
             """
-            for ch in super().__iter__():
-                yield ch
+            return super().__iter__()
 
         def ints(self):
             """
             Returns the list of ASCII integers-codes
             """
-            return list(self.iterInts())
+            return list(super().__iter__())
+
+        def array(self):
+            """
+            Returns the array('B') of ASCII integers-codes
+            """
+            return array('B', self)
+
+        def memview(self):
+            """
+            Returns the read-only memoryview of the octets, without copy
+            """
+            return memoryview(self)
+
+        def ndarray(self):
+            """
+            Returns the read-only numpy uint8 array of ASCII
+            integers-codes, without copy. Requires numpy
+            """
+            import numpy
+            return numpy.frombuffer(self, dtype=numpy.uint8)
+
+        def iterChunks(self, size):
+            """
+            Returns the iterator of consecutive size-long pieces of the
+            bytes-chain, the last one being possibly shorter
+            """
+            if size < 1:
+                raise ValueError("chunk size must be positive")
+            for i in range(0, len(self), size):
+                yield self[i:i+size]
+
+        @classmethod
+        def pack(cls, fmt, *values):
+            """
+            Creates a Byt instance from the values packed according to
+            the fmt struct format
+            """
+            return cls(_struct(fmt).pack(*values))
 
-        def hex(self):
+        def unpack(self, fmt, offset=0):
             """
-            Returns a hexadecimal representation of the bytes-chain
+            Returns the tuple of values unpacked according to the fmt
+            struct format, reading from offset without slicing
             """
-            return ' '.join(super(Byt, ch).hex() for ch in self)
+            return _struct(fmt).unpack_from(self, offset)
+
+        def iterUnpack(self, fmt, offset=0):
+            """
+            Returns the iterator of the tuples of values of consecutive
+            fmt struct format records, from offset to the end
+            """
+            return _iter_unpack(fmt, self, offset)
+
+        def hex(self, sep=' ', group=1, upper=False):
+            """
+            Returns a hexadecimal representation of the bytes-chain,
+            with a sep separator every group octets, in upper or
+            lower case
+            """
+            return _hexlify(self, sep, group, upper)
+
+        def intern(self):
+            """
+            Returns the shared bytes-chain equal to this one: from the
+            single octets table, or from the intern enabled with
+            setInternCache, or the bytes-chain itself
+            """
+            return _intern(type(self), self)
 
         def split(self, sep=None, maxsplit=-1):
             if not isinstance(sep, Byt) and sep is not None:
                 raise TypeError("can't split {} with {}"\
                         .format(type(self).__name__, type(sep).__name__))
-            return list(map(type(self), super().split(sep, maxsplit)))
+            return _split(type(self), super().split(sep, maxsplit))
 
         def rsplit(self, sep=None, maxsplit=-1):
             if not isinstance(sep, Byt) and sep is not None:
                 raise TypeError("can't rsplit {} with {}"\
                         .format(type(self).__name__, type(sep).__name__))
-            return list(map(type(self), super().rsplit(sep, maxsplit)))
+            return _split(type(self), super().rsplit(sep, maxsplit))
 
         def replace(self, old, new, count=-1):
             if not isinstance(old, Byt) or not isinstance(new, Byt):
@@ -255,6 +715,14 @@ else:
             Byt('!"#$')
             >>> str(b)
             '!"#$'
+
+            Construction cost, by input type:
+
+            * Byt of the same class: free, the object itself is returned
+            * int: free, one of the 256 shared single-octet instances
+            * Byt of another class, str: one copy
+            * BytView, memoryview: one copy to str and one copy
+            * list, tuple or generator of ints: one pass over the items
             """
         def __new__(cls, *args):
             l = len(args)
@@ -262,10 +730,18 @@ else:
                 value = args
             elif l == 1:  # one arg
                 value = args[0]
-                if isinstance(value, int):
-                    value = chr(value)
+                if type(value) is cls:
+                    # immutable, share it
+                    return value
+                elif isinstance(value, int):
+                    return _single(cls, value)
                 elif isinstance(value, Byt):
-                    value = value.str()
+                    # DByt.__str__ gives the hexadecimal, not the octets
+                    return super(Byt, cls).__new__(cls, value.str())
+                elif isinstance(value, BytView):
+                    value = value.memview().tobytes()
+                elif isinstance(value, memoryview):
+                    value = value.tobytes()
                 elif isinstance(value, GeneratorType):
                     value = list(value)
             else:  # empty input
@@ -279,17 +755,60 @@ else:
                     value = ''
             return super(Byt, cls).__new__(cls, value)
 
+        @classmethod
+        def frombuffer(cls, buf):
+            """
+            Returns a bytes-chain copied in one pass from any object
+            supporting the buffer protocol: str, bytearray, memoryview,
+            array, mmap, numpy arrays
+
+            >>> Byt.frombuffer(bytearray([104, 105]))
+            Byt('hi')
+            """
+            try:
+                data = memoryview(buf).tobytes()
+            except TypeError:  # old-style buffer, as array
+                data = buffer(buf)[:]
+            return super(Byt, cls).__new__(cls, data)
+
+        @classmethod
+        def fromints(cls, ints):
+            """
+            Returns a bytes-chain from integers in range(0, 256), copied
+            in one pass from an array('B'), iterated otherwise
+
+            >>> Byt.fromints(array('B', [104, 105]))
+            Byt('hi')
+            """
+            if isinstance(ints, array) and ints.typecode == 'B':
+                return super(Byt, cls).__new__(cls, ints.tostring())
+            return super(Byt, cls).__new__(cls, bytearray(ints))
+
         def __getitem__(self, pos):
-            return type(self)(super(Byt, self).__getitem__(pos))
+            res = super(Byt, self).__getitem__(pos)
+            if isinstance(pos, slice):
+                return type(self)(res)
+            return _singles(type(self))[ord(res)]
 
         def __getslice__(self, deb, fin):
             return type(self)(super(Byt, self).__getslice__(deb, fin))
 
+        def view(self, start=None, stop=None):
+            """
+            Returns a zero-copy BytView of the octets between start
+            and stop, sharing the memory of the bytes-chain
+            """
+            return BytView(self, start, stop)
+
         def __eq__(self, other):
             if not isinstance(other, Byt):
-                if isinstance(other, (str, unicode)):
+                if isinstance(other, BytView):
+                    return other.__eq__(self)
+                elif isinstance(other, (str, unicode)):
                     raise TypeError("can't compare {} and {}"\
                             .format(type(self).__name__, type(other).__name__))
+                elif isinstance(other, _rope()):
+                    return other.__eq__(self)
                 else:
                     return False
             else:
@@ -299,20 +818,53 @@ else:
         def fromHex(cls, hexes):
             """
             Creates a Byt instance from a '12 ab 34 cd' string,
-            equivalent to Byt.hex() method output
+            equivalent to Byt.hex() method output. Whitespaces, newlines
+            and 0x prefixes are ignored
+            """
+            return cls(_unhexlify(hexes))
+
+        @classmethod
+        def fromFile(cls, path, offset=0, length=None):
+            """
+            Creates a Byt instance from the content of a file, reading
+            only length octets from offset if provided
+            """
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                return cls(f.read(-1 if length is None else length))
+
+        @classmethod
+        def mmap(cls, path, offset=0, length=None):
             """
-            return cls(unhexlify(hexes.replace(" ", "")))
+            Returns a read-only BytView of a memory-mapped file, or of
+            its length octets from offset if provided; the file content
+            is loaded lazily by the operating system
+            """
+            stop = None if length is None else offset + length
+            with open(path, 'rb') as f:
+                try:
+                    mm = memorymap(f.fileno(), 0, access=ACCESS_READ)
+                except ValueError:  # empty files can't be mapped
+                    return BytView(cls(), offset, stop)
+            return BytView(mm, offset, stop, cls)
 
         def __ne__(self, other):
             if not isinstance(other, Byt):
-                if isinstance(other, (str, unicode)):
+                if isinstance(other, BytView):
+                    return other.__ne__(self)
+                elif isinstance(other, (str, unicode)):
                     raise TypeError("can't compare {} and {}"\
                             .format(type(self).__name__, type(other).__name__))
+                elif isinstance(other, _rope()):
+                    return other.__ne__(self)
                 else:
                     return True
             else:
                 return super(Byt, self).__ne__(other)
 
+        def __reduce_ex__(self, protocol):
+            return _unpickle, (type(self), self.str())
+
         def __str__(self):
             return super(Byt, self).__str__()
 
@@ -330,11 +882,13 @@ else:
                                    repr(self.str()))
 
         def __iter__(self):
-            for ch in super(Byt, self).__str__():
-                yield type(self)(ch)
+            table = _singles(type(self))
+            return (table[ch] for ch in bytearray(self))
 
         def __add__(self, txt):
             if not isinstance(txt, Byt):
+                if isinstance(txt, _rope()):
+                    return txt.__radd__(self)
                 raise TypeError("can't concat {} to {}"\
                         .format(type(self).__name__, type(txt).__name__))
             return type(self)(super(Byt, self).__add__(txt))
@@ -351,47 +905,155 @@ else:
         def __rmul__(self, other):
             return type(self)(super(Byt, self).__rmul__(other))
 
+        def __xor__(self, other):
+            return _bitwise(self, other, xor, 'xor')
+
+        def __and__(self, other):
+            return _bitwise(self, other, and_, 'and')
+
+        def __or__(self, other):
+            return _bitwise(self, other, or_, 'or')
+
+        def __invert__(self):
+            return type(self)(super(Byt, self).translate(_INVERT))
+
+        def __lshift__(self, n):
+            mask = (1 << 8 * len(self)) - 1
+            return _fromint(type(self), (_toint(self) << n) & mask, len(self))
+
+        def __rshift__(self, n):
+            return _fromint(type(self), _toint(self) >> n, len(self))
+
+        def xorKey(self, key):
+            """
+            Returns the bitwise xor of the bytes-chain with the Byt key,
+            repeated over its length
+            """
+            if not isinstance(key, Byt):
+                raise TypeError("can't xor {} with {}"\
+                        .format(type(self).__name__, type(key).__name__))
+            if len(key) == 0:
+                raise ValueError("empty key")
+            stream = key * (len(self) // len(key) + 1)
+            # drops the trailing octets of the repeated key
+            stream = _toint(stream) >> 8 * (len(stream) - len(self))
+            return _fromint(type(self), _toint(self) ^ stream, len(self))
+
         def __contains__(self, other):
             if not isinstance(other, Byt):
                 if not isinstance(other, int):
                     raise TypeError("can't compare {} to {}"\
                             .format(type(self).__name__, type(other).__name__))
+                elif not 0 <= other < 256:
+                    return False
                 else:
-                    return other in self.ints()
+                    return super(Byt, self).__contains__(chr(other))
             else:
                 return super(Byt, self).__contains__(other)
 
+        def byteset(self):
+            """
+            Returns the frozenset of the ASCII integers-codes present in
+            the bytes-chain, computed once and cached
+            """
+            try:
+                return self._byteset
+            except AttributeError:
+                self._byteset = frozenset(self.iterInts())
+                return self._byteset
+
         def iterInts(self):
             """
             Returns the iterator of ASCII integers-codes
             """
-            for ch in self.__iter__():
-                yield ord(ch)
+            return iter(bytearray(self))
 
         def ints(self):
             """
             Returns the list of ASCII integers-codes
             """
-            return list(self.iterInts())
+            return list(bytearray(self))
+
+        def array(self):
+            """
+            Returns the array('B') of ASCII integers-codes
+            """
+            return array('B', self)
+
+        def memview(self):
+            """
+            Returns the read-only memoryview of the octets, without copy
+            """
+            return memoryview(self)
+
+        def ndarray(self):
+            """
+            Returns the read-only numpy uint8 array of ASCII
+            integers-codes, without copy. Requires numpy
+            """
+            import numpy
+            return numpy.frombuffer(self, dtype=numpy.uint8)
+
+        def iterChunks(self, size):
+            """
+            Returns the iterator of consecutive size-long pieces of the
+            bytes-chain, the last one being possibly shorter
+            """
+            if size < 1:
+                raise ValueError("chunk size must be positive")
+            for i in range(0, len(self), size):
+                yield self[i:i+size]
+
+        @classmethod
+        def pack(cls, fmt, *values):
+            """
+            Creates a Byt instance from the values packed according to
+            the fmt struct format
+            """
+            return cls(_struct(fmt).pack(*values))
 
-        def hex(self):
+        def unpack(self, fmt, offset=0):
             """
-            Returns a hexadecimal representation of the bytes-chain
+            Returns the tuple of values unpacked according to the fmt
+            struct format, reading from offset without slicing
             """
-            return ' '.join(hexlify(ch) for ch in self)
+            return _struct(fmt).unpack_from(self, offset)
+
+        def iterUnpack(self, fmt, offset=0):
+            """
+            Returns the iterator of the tuples of values of consecutive
+            fmt struct format records, from offset to the end
+            """
+            return _iter_unpack(fmt, self, offset)
+
+        def hex(self, sep=' ', group=1, upper=False):
+            """
+            Returns a hexadecimal representation of the bytes-chain,
+            with a sep separator every group octets, in upper or
+            lower case
+            """
+            return _hexlify(self, sep, group, upper)
+
+        def intern(self):
+            """
+            Returns the shared bytes-chain equal to this one: from the
+            single octets table, or from the intern enabled with
+            setInternCache, or the bytes-chain itself
+            """
+            return _intern(type(self), self)
 
         def split(self, sep=None, maxsplit=-1):
             if not isinstance(sep, Byt) and sep is not None:
                 raise TypeError("can't split {} with {}"\
                         .format(type(self).__name__, type(sep).__name__))
-            return list(map(type(self), super(Byt, self).split(sep, maxsplit)))
+            return _split(type(self), super(Byt, self).split(sep, maxsplit))
 
         def rsplit(self, sep=None, maxsplit=-1):
             if not isinstance(sep, Byt) and sep is not None:
                 raise TypeError("can't rsplit {} with {}"\
                         .format(type(self).__name__, type(sep).__name__))
-            return list(map(type(self),
-                            super(Byt, self).rsplit(sep, maxsplit)))
+            return _split(type(self),
+                          super(Byt, self).rsplit(sep, maxsplit))
 
         def replace(self, old, new, count=-1):
             if not isinstance(old, Byt) or not isinstance(new, Byt):
@@ -472,3 +1134,335 @@ class DByt(Byt):
     def __repr__(self):
         return "{}({})".format(self.__class__.__name__,
                                repr(super(DByt, self).__str__()))
+
+    def iterHexdump(self, width=16, group=2, offset=0, length=None):
+        """
+        Returns the iterator of xxd-like lines: offset, hexadecimal
+        columns of width octets grouped by group, and ASCII gutter.
+        Only length octets from offset are dumped, if provided
+
+        >>> for line in DByt('hello world!').iterHexdump(8):
+        ...     print(line)
+        00000000: 6865 6c6c 6f20 776f  hello wo
+        00000008: 726c 6421            rld!
+        """
+        return _hexdump(self, width, group, offset, length)
+
+    def hexdump(self, fileobj=None, width=16, group=2, offset=0,
+                length=None):
+        """
+        Writes the xxd-like dump lines to the fileobj file-like object,
+        one at a time; or returns the whole dump as a string if fileobj
+        is not provided
+        """
+        lines = self.iterHexdump(width, group, offset, length)
+        if fileobj is None:
+            return '\n'.join(lines)
+        for line in lines:
+            fileobj.write(line + '\n')
+
+
+class BytView(object):
+    """Read-only window over a Byt bytes-chain, sharing its memory
+
+    Slicing a BytView returns another BytView without copying any octet,
+    the Byt (or DByt) is only materialized when calling the byt method.
+    Comparisons and searches follow the Byt strictness rules. A BytView
+    may also wrap a read-only memory-mapped file, see Byt.mmap, or a
+    memoryview.
+
+    >>> b = Byt('hello world!')
+    >>> v = b.view(6, 11)
+    >>> v
+    BytView(Byt('world'))
+    >>> v[1:3] == Byt('or')
+    True
+    >>> v.find(Byt('l'))
+    3
+    """
+    __slots__ = ('_base', '_start', '_stop', '_cls')
+
+    def __init__(self, value, start=None, stop=None, cls=None):
+        if isinstance(value, BytView):
+            base, offset, length = value._base, value._start, len(value)
+            cls = cls or value._cls
+        elif isinstance(value, Byt):
+            base, offset, length = value, 0, len(value)
+            cls = cls or type(value)
+        elif isinstance(value, memorymap):
+            base, offset, length = value, 0, len(value)
+            cls = cls or Byt
+        elif isinstance(value, memoryview):
+            if not PYTHON3:
+                # Python 2 re can't scan memoryviews, the octets are copied
+                base = Byt(value.tobytes())
+            elif not value.c_contiguous:
+                raise ValueError("can't view non-contiguous memoryview")
+            elif value.format != 'B':
+                base = value.cast('B')
+            else:
+                base = value
+            offset, length = 0, len(base)
+            cls = cls or Byt
+        else:
+            raise TypeError("can't view {}".format(type(value).__name__))
+        start, stop, _ = slice(start, stop).indices(length)
+        self._base = base
+        self._cls = cls
+        self._start = offset + start
+        self._stop = offset + max(start, stop)
+
+    def _bounds(self, start, end):
+        start, end, _ = slice(start, end).indices(len(self))
+        return self._start + start, self._start + end
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            if pos.step is None or pos.step == 1:
+                return BytView(self, pos.start, pos.stop)
+            if PYTHON3:
+                # copies the selected octets only
+                return self._cls(self.memview()[pos])
+            # Python 2 memoryviews can't be strided
+            return self.byt()[pos]
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos < len(self):
+            raise IndexError("index out of range")
+        res = self._base[self._start + pos]
+        return res if isinstance(res, Byt) else self._cls(res)
+
+    def _memview(self, start, stop):
+        if not PYTHON3 and isinstance(self._base, memorymap):
+            # Python 2 mmap has no new-style buffer, slicing copies
+            return memoryview(self._base[start:stop])
+        return memoryview(self._base)[start:stop]
+
+    def memview(self):
+        """
+        Returns the memoryview of the octets, without copy (except for
+        memory-mapped files on Python 2)
+        """
+        return self._memview(self._start, self._stop)
+
+    def byt(self):
+        """
+        Materializes the view into a new Byt (or DByt) instance
+        """
+        return self._cls(self)
+
+    def str(self):
+        """
+        Returns an ISO-8859-1/ASCII representation of the octets
+        """
+        return self.byt().str()
+
+    def __str__(self):
+        return str(self.byt())
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, repr(self.byt()))
+
+    def __eq__(self, other):
+        if not isinstance(other, (Byt, BytView)):
+            if isinstance(other, (str, bytes, type(u''))):
+                raise TypeError("can't compare {} and {}"\
+                        .format(type(self).__name__, type(other).__name__))
+            elif isinstance(other, _rope()):
+                return other.__eq__(self)
+            else:
+                return False
+        elif isinstance(other, Byt):
+            other = memoryview(other)
+        else:
+            other = other.memview()
+        return self.memview() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        # memoryviews hash only over hashable objects
+        if PYTHON3 and isinstance(self._base, Byt):
+            return hash(self.memview())
+        return hash(self.memview().tobytes())
+
+    def __iter__(self):
+        table = _singles(self._cls)
+        return (table[ch] for ch in self.iterInts())
+
+    def iterInts(self):
+        """
+        Returns the iterator of ASCII integers-codes
+        """
+        if PYTHON3:
+            return iter(self.memview())
+        return iter(bytearray(self.memview()))
+
+    def ints(self):
+        """
+        Returns the list of ASCII integers-codes
+        """
+        return list(self.iterInts())
+
+    def close(self):
+        """
+        Closes the memory-mapped file underlying the view, if any
+        """
+        if isinstance(self._base, memorymap):
+            self._base.close()
+
+    def array(self):
+        """
+        Returns the array('B') of ASCII integers-codes
+        """
+        res = array('B')
+        if PYTHON3:
+            res.frombytes(self.memview())
+        else:
+            res.fromstring(self.memview().tobytes())
+        return res
+
+    def ndarray(self):
+        """
+        Returns the read-only numpy uint8 array of ASCII integers-codes,
+        without copy. Requires numpy
+        """
+        import numpy
+        return numpy.frombuffer(self.memview(), dtype=numpy.uint8)
+
+    def iterChunks(self, size):
+        """
+        Returns the iterator of consecutive size-long BytView pieces,
+        the last one being possibly shorter
+        """
+        if size < 1:
+            raise ValueError("chunk size must be positive")
+        for i in range(0, len(self), size):
+            yield BytView(self, i, i + size)
+
+    def unpack(self, fmt, offset=0):
+        """
+        Returns the tuple of values unpacked according to the fmt struct
+        format, reading from offset without slicing
+        """
+        return _struct(fmt).unpack_from(self.memview(), offset)
+
+    def iterUnpack(self, fmt, offset=0):
+        """
+        Returns the iterator of the tuples of values of consecutive fmt
+        struct format records, from offset to the end
+        """
+        return _iter_unpack(fmt, self.memview(), offset)
+
+    def hex(self, sep=' ', group=1, upper=False):
+        """
+        Returns a hexadecimal representation of the bytes-chain,
+        with a sep separator every group octets, in upper or lower case
+        """
+        return _hexlify(self.memview(), sep, group, upper)
+
+    def __contains__(self, other):
+        if isinstance(other, BytView):
+            other = other.byt()
+        if not isinstance(other, Byt):
+            if not isinstance(other, int):
+                raise TypeError("can't compare {} to {}"\
+                        .format(type(self).__name__, type(other).__name__))
+            elif not 0 <= other < 256:
+                return False
+            other = Byt(other)
+        return self.find(other) != -1
+
+    def find(self, sub, start=None, end=None):
+        if isinstance(sub, BytView):
+            sub = sub.byt()
+        if not isinstance(sub, Byt):
+            raise TypeError("can't find {} in {}"\
+                    .format(type(sub).__name__, type(self).__name__))
+        start, end = self._bounds(start, end)
+        if isinstance(self._base, memoryview):
+            # memoryviews have no search methods, re scans them in place
+            match = re_compile(re_escape(sub)).search(self._base, start, end)
+            idx = -1 if match is None else match.start()
+        else:
+            idx = self._base.find(sub, start, end)
+        return idx if idx == -1 else idx - self._start
+
+    def rfind(self, sub, start=None, end=None):
+        if isinstance(sub, BytView):
+            sub = sub.byt()
+        if not isinstance(sub, Byt):
+            raise TypeError("can't find {} in {}"\
+                    .format(type(sub).__name__, type(self).__name__))
+        start, end = self._bounds(start, end)
+        if isinstance(self._base, memoryview):
+            # lookahead, to find overlapping occurences
+            idx = -1
+            for match in re_compile(b'(?=' + re_escape(sub) + b')')\
+                    .finditer(self._base, start, end):
+                idx = match.start()
+        else:
+            idx = self._base.rfind(sub, start, end)
+        return idx if idx == -1 else idx - self._start
+
+    def count(self, sub, start=None, end=None):
+        if isinstance(sub, BytView):
+            sub = sub.byt()
+        if not isinstance(sub, Byt):
+            raise TypeError("can't count {} in {}"\
+                    .format(type(sub).__name__, type(self).__name__))
+        start, end = self._bounds(start, end)
+        if isinstance(self._base, Byt):
+            return self._base.count(sub, start, end)
+        elif isinstance(self._base, memoryview):
+            return len(re_compile(re_escape(sub))\
+                    .findall(self._base, start, end))
+        # memory-maps have no count method
+        if len(sub) == 0:
+            return end - start + 1
+        res = 0
+        idx = self._base.find(sub, start, end)
+        while idx != -1:
+            res += 1
+            idx = self._base.find(sub, idx + len(sub), end)
+        return res
+
+    def endswith(self, suffix, start=None, end=None):
+        if isinstance(suffix, BytView):
+            suffix = suffix.byt()
+        if not isinstance(suffix, Byt):
+            raise TypeError("can't search {} in {}"\
+                    .format(type(suffix).__name__, type(self).__name__))
+        start, end = self._bounds(start, end)
+        if isinstance(self._base, Byt):
+            return self._base.endswith(suffix, start, end)
+        return end - start >= len(suffix) and memoryview(suffix) == \
+            self._memview(end - len(suffix), end)
+
+    def startswith(self, prefix, start=None, end=None):
+        if isinstance(prefix, BytView):
+            prefix = prefix.byt()
+        if not isinstance(prefix, Byt):
+            raise TypeError("can't search {} in {}"\
+                    .format(type(prefix).__name__, type(self).__name__))
+        start, end = self._bounds(start, end)
+        if isinstance(self._base, Byt):
+            return self._base.startswith(prefix, start, end)
+        return end - start >= len(prefix) and memoryview(prefix) == \
+            self._memview(start, start + len(prefix))
+
+
+# compiled accelerator of the hottest Byt methods, if built; setting the
+# BYT_NO_SPEEDUPS environment variable forces the pure python methods
+SPEEDUPS = False
+if PYTHON3 and not environ.get('BYT_NO_SPEEDUPS'):
+    try:
+        from ._speedups import install as _install
+    except ImportError:
+        pass
+    else:
+        SPEEDUPS = _install(Byt, _SINGLES, _singles)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from array import array
+from binascii import crc_hqx
+from functools import reduce
+from operator import xor
+from sys import byteorder
+from zlib import crc32
+
+from .byt import Byt, BytView, PYTHON3
+
+try:
+    from itertools import accumulate
+except ImportError:  # python2
+    accumulate = None
+
+
+__all__ = ["Checksum", "Crc8", "Crc16Xmodem", "Crc16Ccitt", "Crc16Arc",
+           "Crc16Modbus", "Crc32", "Fletcher16", "Fletcher32", "Sum8",
+           "Xor8"]
+
+
+def _buffer(data):
+    """
+    Returns the buffer of a Byt or BytView
+    """
+    if isinstance(data, BytView):
+        return data.memview() if PYTHON3 else data.memview().tobytes()
+    elif isinstance(data, Byt):
+        return data
+    raise TypeError("can't checksum {}".format(type(data).__name__))
+
+
+def _codes(buf):
+    """
+    Returns an iterable of the integer-codes of a buffer
+    """
+    return memoryview(buf) if PYTHON3 else bytearray(buf)
+
+
+class Checksum(object):
+    """Incremental checksum of Byt or BytView data, base class
+
+    Data is fed through update, the checksum is given by value (int),
+    byt or hex; compute is the one-shot shortcut.
+
+    >>> Crc32.compute(Byt('123456789')) == 0xcbf43926
+    True
+    >>> c = Crc16Modbus(Byt('1234'))
+    >>> c.update(Byt('56789'))
+    >>> c.hex()
+    '4b 37'
+    """
+    # checksum width in bits
+    width = 8
+    # initial register
+    init = 0
+
+    def __init__(self, data=None):
+        self._reg = self.init
+        if data is not None:
+            self.update(data)
+
+    @classmethod
+    def compute(cls, data):
+        """
+        Returns the checksum of a Byt or BytView, as an integer
+        """
+        return cls(data).value()
+
+    def update(self, data):
+        """
+        Feeds a Byt or BytView to the checksum
+        """
+        self._reg = self._update(self._reg, _buffer(data))
+
+    def _update(self, reg, buf):
+        raise NotImplementedError
+
+    def value(self):
+        """
+        Returns the checksum as an integer
+        """
+        return self._reg
+
+    def byt(self):
+        """
+        Returns the checksum as a big-endian Byt
+        """
+        value = self.value()
+        return Byt([value >> shift & 0xff
+                    for shift in range(self.width - 8, -8, -8)])
+
+    def hex(self):
+        """
+        Returns a hexadecimal representation of the checksum
+        """
+        return self.byt().hex()
+
+    def copy(self):
+        """
+        Returns a copy of the checksum in its current state
+        """
+        res = self.__class__()
+        res.__dict__.update(self.__dict__)
+        return res
+
+    def __repr__(self):
+        return "{}(0x{:0{}x})".format(self.__class__.__name__, self.value(),
+                                      self.width // 4)
+
+
+class _TableCrc(Checksum):
+    """Table-driven CRC of parameters width, poly, init, reflected
+    (input and output) and xorout
+    """
+    poly = 0
+    reflected = False
+    xorout = 0
+    _table = None
+
+    @classmethod
+    def _build(cls):
+        mask = (1 << cls.width) - 1
+        table = []
+        for byte in range(256):
+            if cls.reflected:
+                poly = int('{:0{}b}'.format(cls.poly, cls.width)[::-1], 2)
+                reg = byte
+                for _ in range(8):
+                    reg = (reg >> 1) ^ poly if reg & 1 else reg >> 1
+            else:
+                top = 1 << (cls.width - 1)
+                reg = byte << (cls.width - 8)
+                for _ in range(8):
+                    reg = ((reg << 1) ^ cls.poly if reg & top
+                           else reg << 1) & mask
+            table.append(reg)
+        cls._table = table
+
+    def _update(self, reg, buf):
+        cls = self.__class__
+        if cls.__dict__.get('_table') is None:
+            cls._build()
+        table = cls._table
+        if self.reflected:
+            for c in _codes(buf):
+                reg = table[(reg ^ c) & 0xff] ^ (reg >> 8)
+        elif self.width == 8:
+            for c in _codes(buf):
+                reg = table[reg ^ c]
+        else:
+            shift = self.width - 8
+            mask = (1 << self.width) - 1
+            for c in _codes(buf):
+                reg = table[(reg >> shift) ^ c] ^ ((reg << 8) & mask)
+        return reg
+
+    def value(self):
+        return self._reg ^ self.xorout
+
+
+class Crc8(_TableCrc):
+    """CRC-8 (SMBus): polynomial 0x07, table-driven
+    """
+    poly = 0x07
+
+
+class Crc16Xmodem(Checksum):
+    """CRC-16/XMODEM: polynomial 0x1021, initial 0, through
+    binascii.crc_hqx
+    """
+    width = 16
+
+    def _update(self, reg, buf):
+        return crc_hqx(buf, reg)
+
+
+class Crc16Ccitt(Crc16Xmodem):
+    """CRC-16/CCITT-FALSE: polynomial 0x1021, initial 0xffff, through
+    binascii.crc_hqx
+    """
+    init = 0xffff
+
+
+class Crc16Arc(_TableCrc):
+    """CRC-16/ARC: reflected polynomial 0x8005, initial 0,
+    table-driven
+    """
+    width = 16
+    poly = 0x8005
+    reflected = True
+
+
+class Crc16Modbus(Crc16Arc):
+    """CRC-16/MODBUS: reflected polynomial 0x8005, initial 0xffff,
+    table-driven
+    """
+    init = 0xffff
+
+
+class Crc32(Checksum):
+    """CRC-32 (ISO-HDLC, as zip and ethernet), through zlib.crc32
+    """
+    width = 32
+
+    def _update(self, reg, buf):
+        return crc32(buf, reg) & 0xffffffff
+
+
+class Fletcher16(Checksum):
+    """Fletcher-16 checksum over octets, modulo 255, computed in bulk
+    """
+    width = 16
+
+    def _update(self, reg, buf):
+        sum2, sum1 = reg >> 8, reg & 0xff
+        codes = _codes(buf)
+        if accumulate is not None:
+            sum2 += len(buf) * sum1 + sum(accumulate(codes))
+            sum1 += sum(codes)
+        else:
+            for c in codes:
+                sum1 += c
+                sum2 += sum1
+        return (sum2 % 255) << 8 | (sum1 % 255)
+
+
+class Fletcher32(Checksum):
+    """Fletcher-32 checksum over little-endian 16-bit words, modulo
+    65535, computed in bulk; an odd trailing octet is padded with zero
+    """
+    width = 32
+
+    def __init__(self, data=None):
+        self._odd = None
+        super(Fletcher32, self).__init__(data)
+
+    def _update(self, reg, buf):
+        buf = bytearray(buf)
+        if self._odd is not None:
+            buf[0:0] = self._odd
+            self._odd = None
+        if len(buf) % 2:
+            self._odd = buf[-1:]
+            del buf[-1:]
+        words = array('H')
+        words.frombytes(bytes(buf)) if PYTHON3 else words.fromstring(str(buf))
+        if byteorder == 'big':
+            words.byteswap()
+        return self._sums(reg, words)
+
+    @staticmethod
+    def _sums(reg, words):
+        sum2, sum1 = reg >> 16, reg & 0xffff
+        if accumulate is not None:
+            sum2 += len(words) * sum1 + sum(accumulate(words))
+            sum1 += sum(words)
+        else:
+            for w in words:
+                sum1 += w
+                sum2 += sum1
+        return (sum2 % 65535) << 16 | (sum1 % 65535)
+
+    def value(self):
+        if self._odd is None:
+            return self._reg
+        return self._sums(self._reg, [self._odd[0]])
+
+
+class Sum8(Checksum):
+    """Additive checksum, sum of the octets modulo 256
+    """
+    def _update(self, reg, buf):
+        return (reg + sum(_codes(buf))) & 0xff
+
+
+class Xor8(Checksum):
+    """XOR checksum of the octets
+    """
+    def _update(self, reg, buf):
+        if not PYTHON3:
+            return reduce(xor, _codes(buf), reg)
+        # folds the halves of the octets as a single integer
+        size = len(buf)
+        value = int.from_bytes(buf, 'little')
+        while size > 1:
+            size -= size // 2
+            value = (value >> 8 * size) ^ (value & ((1 << 8 * size) - 1))
+        return reg ^ value
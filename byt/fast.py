@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+"""
+Trusted fast mode: the Byt operations without the type checks
+
+The functions of this module are bound directly to the native bytes
+(str on python 2) methods, skipping the isinstance checks and the Byt
+method dispatch. They are meant for hot inner loops over Byt already
+validated: given anything else, they behave as the native methods do.
+Functions building a bytes-chain return it in the class of their first
+argument.
+
+>>> from byt import Byt, fast
+>>> b = Byt('key=value')
+>>> fast.find(b, Byt('='))
+3
+>>> fast.split(b, Byt('='))
+[Byt('key'), Byt('value')]
+"""
+
+
+__all__ = ["find", "rfind", "index", "rindex", "count", "startswith",
+           "endswith", "contains", "eq", "ne", "add", "split", "rsplit",
+           "strip", "lstrip", "rstrip", "replace", "join"]
+
+
+_new = bytes.__new__
+_add = bytes.__add__
+_split = bytes.split
+_rsplit = bytes.rsplit
+_strip = bytes.strip
+_lstrip = bytes.lstrip
+_rstrip = bytes.rstrip
+_replace = bytes.replace
+_join = bytes.join
+
+
+# searches and comparisons return no bytes-chain, the native methods
+# are used as they are
+find = bytes.find
+rfind = bytes.rfind
+index = bytes.index
+rindex = bytes.rindex
+count = bytes.count
+startswith = bytes.startswith
+endswith = bytes.endswith
+contains = bytes.__contains__
+eq = bytes.__eq__
+ne = bytes.__ne__
+
+
+def add(value, other):
+    """
+    Returns the concatenation of value and other
+    """
+    return _new(type(value), _add(value, other))
+
+
+def split(value, sep=None, maxsplit=-1):
+    """
+    Returns the list of the parts of value split by sep
+    """
+    cls = type(value)
+    return [_new(cls, part) for part in _split(value, sep, maxsplit)]
+
+
+def rsplit(value, sep=None, maxsplit=-1):
+    """
+    Returns the list of the parts of value split by sep, from the right
+    """
+    cls = type(value)
+    return [_new(cls, part) for part in _rsplit(value, sep, maxsplit)]
+
+
+def strip(value, chars=None):
+    """
+    Returns value without its leading and trailing chars
+    """
+    return _new(type(value), _strip(value, chars))
+
+
+def lstrip(value, chars=None):
+    """
+    Returns value without its leading chars
+    """
+    return _new(type(value), _lstrip(value, chars))
+
+
+def rstrip(value, chars=None):
+    """
+    Returns value without its trailing chars
+    """
+    return _new(type(value), _rstrip(value, chars))
+
+
+def replace(value, old, new, count=-1):
+    """
+    Returns value with the count first occurrences of old replaced by new
+    """
+    return _new(type(value), _replace(value, old, new, count))
+
+
+def join(sep, parts):
+    """
+    Returns the concatenation of the parts, separated by sep
+    """
+    return _new(type(sep), _join(sep, parts))
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from struct import Struct
+
+from .byt import Byt, BytView, PYTHON3
+
+
+__all__ = ["Framer", "DelimiterFramer", "LengthFramer", "CobsFramer",
+           "SlipFramer"]
+
+
+class Framer(object):
+    """Incremental splitter of a bytes stream into Byt frames
+
+    Chunks are appended to an internal buffer, from which the complete
+    frames are extracted; the consumed octets are discarded once they
+    take more than half of the buffer, so that framing costs linear time
+    and memory bounded by the largest frame. Framer is the base class,
+    see DelimiterFramer, LengthFramer, CobsFramer and SlipFramer.
+    """
+    def __init__(self, cls=Byt, maxsize=None):
+        self.cls = cls
+        self.maxsize = maxsize
+        # number of invalid frames discarded
+        self.dropped = 0
+        self.reset()
+
+    def reset(self):
+        """
+        Discards the pending octets
+        """
+        self._buf = bytearray()
+        self._pos = 0
+        self._scan = 0
+
+    def __len__(self):
+        return len(self._buf) - self._pos
+
+    def feed(self, chunk):
+        """
+        Appends a Byt chunk to the stream, returns the list of the
+        frames completed; see _feed for frames exceeding maxsize
+        """
+        if isinstance(chunk, BytView):
+            chunk = chunk.memview() if PYTHON3 else chunk.memview().tobytes()
+        elif not isinstance(chunk, Byt):
+            raise TypeError("can't feed {} to {}"\
+                    .format(type(chunk).__name__, type(self).__name__))
+        return self._feed(chunk)
+
+    def _feed(self, chunk):
+        """
+        Appends any buffer to the stream, without type check; a frame
+        exceeding maxsize resets the framer and raises a ValueError,
+        whose frames attribute holds the frames completed before it
+        """
+        self._buf.extend(chunk)
+        frames = []
+        try:
+            frame = self._next()
+            while frame is not None:
+                frames.append(frame)
+                frame = self._next()
+        except ValueError as exc:
+            exc.frames = frames
+            raise
+        if self._pos * 2 >= len(self._buf):
+            del self._buf[:self._pos]
+            self._scan -= self._pos
+            self._pos = 0
+        if self.maxsize is not None and len(self) > self.maxsize:
+            self.reset()
+            exc = ValueError("pending frame exceeds {} octets"\
+                    .format(self.maxsize))
+            exc.frames = frames
+            raise exc
+        return frames
+
+    def _take(self, start, stop):
+        if PYTHON3:
+            return self.cls(memoryview(self._buf)[start:stop])
+        return self.cls(str(self._buf[start:stop]))
+
+    def _next(self):
+        """
+        Returns the next complete frame of the buffer, or None
+        """
+        raise NotImplementedError
+
+    def encode(self, payload):
+        """
+        Returns the Byt frame of a Byt payload
+        """
+        raise NotImplementedError
+
+
+class DelimiterFramer(Framer):
+    """Splits a stream on a Byt delimiter, which is removed from frames
+
+    >>> f = DelimiterFramer(Byt(';'))
+    >>> f.feed(Byt('ab;cd'))
+    [Byt('ab')]
+    >>> f.feed(Byt(';'))
+    [Byt('cd')]
+    """
+    # whether empty frames are returned
+    empty = True
+
+    def __init__(self, delimiter, cls=Byt, maxsize=None):
+        if not isinstance(delimiter, Byt):
+            raise TypeError("can't split with {}"\
+                    .format(type(delimiter).__name__))
+        if len(delimiter) == 0:
+            raise ValueError("empty delimiter")
+        self.delimiter = delimiter
+        super(DelimiterFramer, self).__init__(cls, maxsize)
+
+    def _next(self):
+        while True:
+            idx = self._buf.find(self.delimiter, max(self._scan, self._pos))
+            if idx == -1:
+                # resumes the scan where it stopped
+                self._scan = max(self._pos,
+                                 len(self._buf) - len(self.delimiter) + 1)
+                return None
+            start = self._pos
+            self._pos = self._scan = idx + len(self.delimiter)
+            if start == idx and not self.empty:
+                continue
+            try:
+                return self._frame(start, idx)
+            except ValueError:
+                self.dropped += 1
+
+    def _frame(self, start, stop):
+        return self._take(start, stop)
+
+    def encode(self, payload):
+        if not isinstance(payload, Byt):
+            raise TypeError("can't encode {}".format(type(payload).__name__))
+        if self.delimiter in payload:
+            raise ValueError("payload contains the delimiter")
+        return self.cls(payload + self.delimiter)
+
+
+class LengthFramer(Framer):
+    """Splits a stream of frames prefixed by their length, given as a
+    struct format integer, the prefix being removed from frames
+
+    >>> f = LengthFramer('>H')
+    >>> f.feed(Byt(0, 2, 97))
+    []
+    >>> f.feed(Byt(98, 0, 0))
+    [Byt('ab'), Byt('')]
+    """
+    def __init__(self, fmt='>H', cls=Byt, maxsize=None):
+        self.header = Struct(fmt)
+        super(LengthFramer, self).__init__(cls, maxsize)
+
+    def _next(self):
+        start = self._pos + self.header.size
+        if len(self._buf) < start:
+            return None
+        size, = self.header.unpack_from(self._buf, self._pos)
+        if self.maxsize is not None and size > self.maxsize:
+            self.reset()
+            raise ValueError("frame exceeds {} octets".format(self.maxsize))
+        if len(self._buf) < start + size:
+            return None
+        self._pos = start + size
+        return self._take(start, start + size)
+
+    def encode(self, payload):
+        if not isinstance(payload, Byt):
+            raise TypeError("can't encode {}".format(type(payload).__name__))
+        return self.cls(self.header.pack(len(payload))) + payload
+
+
+class CobsFramer(DelimiterFramer):
+    """Splits a stream of Consistent Overhead Byte Stuffing frames,
+    delimited by null octets; invalid frames are counted in dropped
+
+    >>> f = CobsFramer()
+    >>> f.encode(Byt.fromHex('61 00 62')).hex()
+    '02 61 02 62 00'
+    >>> f.feed(Byt.fromHex('02 61 02 62 00'))[0].hex()
+    '61 00 62'
+    """
+    empty = False
+
+    def __init__(self, cls=Byt, maxsize=None):
+        super(CobsFramer, self).__init__(Byt(0), cls, maxsize)
+
+    def _frame(self, start, stop):
+        buf = self._buf
+        res = bytearray()
+        pos = start
+        while pos < stop:
+            code = buf[pos]
+            end = pos + code
+            if code == 0 or end > stop:
+                raise ValueError("invalid COBS frame")
+            res += buf[pos+1:end]
+            pos = end
+            if code < 255 and pos < stop:
+                res.append(0)
+        return self.cls(bytes(res))
+
+    def encode(self, payload):
+        if not isinstance(payload, Byt):
+            raise TypeError("can't encode {}".format(type(payload).__name__))
+        res = bytearray()
+        for seg in bytes(payload).split(b'\x00'):
+            while len(seg) >= 254:
+                res.append(255)
+                res += seg[:254]
+                seg = seg[254:]
+            res.append(len(seg) + 1)
+            res += seg
+        res.append(0)
+        return self.cls(bytes(res))
+
+
+class SlipFramer(DelimiterFramer):
+    """Splits a stream of Serial Line Internet Protocol frames (RFC 1055)
+
+    >>> f = SlipFramer()
+    >>> f.encode(Byt.fromHex('61 c0')).hex()
+    'c0 61 db dc c0'
+    >>> f.feed(Byt.fromHex('c0 61 db dc c0'))[0].hex()
+    '61 c0'
+    """
+    empty = False
+
+    def __init__(self, cls=Byt, maxsize=None):
+        super(SlipFramer, self).__init__(Byt(0xc0), cls, maxsize)
+
+    def _frame(self, start, stop):
+        res = bytes(self._buf[start:stop])
+        if b'\xdb' in res:
+            res = res.replace(b'\xdb\xdc', b'\xc0').replace(b'\xdb\xdd',
+                                                            b'\xdb')
+        return self.cls(res)
+
+    def encode(self, payload):
+        if not isinstance(payload, Byt):
+            raise TypeError("can't encode {}".format(type(payload).__name__))
+        res = bytes(payload).replace(b'\xdb', b'\xdb\xdd')\
+                            .replace(b'\xc0', b'\xdb\xdc')
+        return self.cls(b'\xc0' + res + b'\xc0')
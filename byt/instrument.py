@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from contextlib import contextmanager
+from functools import wraps
+from threading import local
+from timeit import default_timer
+from types import FunctionType
+
+from .byt import Byt, DByt, _SINGLES
+
+
+__all__ = ["enable", "disable", "enabled", "reset", "snapshot", "measure"]
+
+
+# instrumented classes, their methods are wrapped by enable
+_CLASSES = (Byt, DByt)
+
+# methods installed by the compiled accelerator
+_DESCRIPTOR = type(bytes.find)
+
+# (class, attribute name): original attribute, while enabled
+_ORIGINALS = {}
+
+# 'Class.method': [calls, octets, allocations, seconds]
+_STATS = {}
+
+# per-thread stack of the instrumented methods being run
+_ACTIVE = local()
+
+
+def _allocated(value, result):
+    """
+    Returns whether the constructor built a new object, rather than
+    returning its input or a shared single-octet instance
+    """
+    if result is value or not isinstance(result, Byt):
+        return False
+    if bytes.__len__(result) == 1:
+        table = _SINGLES.get(type(result))
+        return table is None or table[ord(result)] is not result
+    return True
+
+
+def _wrap(name, fct):
+    """
+    Returns the counting wrapper of the function fct named name
+    """
+    stats = _STATS.setdefault(name, [0, 0, 0, 0.])
+    constructor = name.endswith('.__new__')
+
+    @wraps(fct)
+    def wrapper(*args, **kwargs):
+        stack = _ACTIVE.__dict__.setdefault('stack', [])
+        stack.append(stats)
+        start = default_timer()
+        try:
+            res = fct(*args, **kwargs)
+        finally:
+            stats[3] += default_timer() - start
+            stack.pop()
+        stats[0] += 1
+        if args and isinstance(args[0], Byt):
+            stats[1] += bytes.__len__(args[0])
+        elif isinstance(res, Byt):
+            stats[1] += bytes.__len__(res)
+        if constructor and _allocated(args[1] if len(args) == 2 else None,
+                                      res):
+            # allocations are charged to the outermost method
+            (stack[0] if stack else stats)[2] += 1
+        return res
+    return wrapper
+
+
+def enabled():
+    """
+    Returns whether the instrumentation is enabled
+    """
+    return bool(_ORIGINALS)
+
+
+def enable():
+    """
+    Wraps the methods of Byt and DByt to count, per method, the calls,
+    the octets processed (length of the instance, or of the bytes-chain
+    built by constructors), the Byt allocated by the constructor and
+    the cumulative time in seconds. Allocations are charged to the
+    outermost instrumented method, timings are inclusive
+    """
+    if enabled():
+        return
+    for cls in _CLASSES:
+        for attr, value in list(cls.__dict__.items()):
+            name = "{}.{}".format(cls.__name__, attr)
+            if isinstance(value, (FunctionType, _DESCRIPTOR)):
+                wrapped = _wrap(name, value)
+            elif isinstance(value, (staticmethod, classmethod)):
+                wrapped = type(value)(_wrap(name, value.__func__))
+            else:
+                continue
+            _ORIGINALS[cls, attr] = value
+            setattr(cls, attr, wrapped)
+
+
+def disable():
+    """
+    Restores the original methods, no wrapper remains; the counters are
+    kept until reset
+    """
+    while _ORIGINALS:
+        (cls, attr), value = _ORIGINALS.popitem()
+        setattr(cls, attr, value)
+
+
+def reset():
+    """
+    Zeroes all the counters
+    """
+    for stats in _STATS.values():
+        stats[:] = [0, 0, 0, 0.]
+
+
+def snapshot():
+    """
+    Returns the counters of the methods called at least once, as a dict
+    of 'Class.method': {'calls', 'bytes', 'allocations', 'time'}
+    """
+    return dict((name, {"calls": calls, "bytes": octets,
+                        "allocations": allocs, "time": seconds})
+                for name, (calls, octets, allocs, seconds)
+                in _STATS.items() if calls)
+
+
+@contextmanager
+def measure():
+    """
+    Context manager counting the Byt operations of its block, into the
+    snapshot-like dict it gives; enables the instrumentation for the
+    block if it is not already
+
+    >>> with measure() as stats:
+    ...     _ = Byt('ab') + Byt('cd')
+    >>> stats['Byt.__add__']['calls']
+    1
+    """
+    was_enabled = enabled()
+    enable()
+    before = snapshot()
+    res = {}
+    try:
+        yield res
+    finally:
+        for name, after in snapshot().items():
+            prev = before.get(name)
+            if prev is not None:
+                after = dict((key, after[key] - prev[key]) for key in after)
+            if after["calls"]:
+                res[name] = after
+        if not was_enabled:
+            disable()
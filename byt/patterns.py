@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from collections import deque
+from re import compile as re_compile
+from re import DOTALL
+
+from .byt import Byt, BytView, PYTHON3
+
+
+__all__ = ["PatternSet", "HexPattern", "compileHexPattern"]
+
+
+# one token of a hexadecimal pattern: octets, wildcard or nibble mask,
+# with an optional repetition suffix
+_TOKEN = re_compile(r'^(?:0[xX])?(?P<core>(?:[0-9a-fA-F]{2})+|\?\?|\.\.|'
+                    r'[0-9a-fA-F?][0-9a-fA-F?])(?P<rep>\{\d+(?:,\d*)?\})?$')
+
+
+def _codes(value):
+    """
+    Returns an iterable of the integer-codes of a Byt or BytView,
+    without copy on python3
+    """
+    if isinstance(value, BytView):
+        value = value.memview()
+    elif isinstance(value, Byt):
+        value = memoryview(value)
+    else:
+        raise TypeError("can't search {}".format(type(value).__name__))
+    return value if PYTHON3 else bytearray(value.tobytes())
+
+
+def _buffer(value):
+    """
+    Returns the buffer of a Byt or BytView, for the re module
+    """
+    if isinstance(value, BytView):
+        value = value.memview()
+    elif isinstance(value, Byt):
+        value = memoryview(value)
+    else:
+        raise TypeError("can't search {}".format(type(value).__name__))
+    return value if PYTHON3 else value.tobytes()
+
+
+class PatternSet(object):
+    """Multi-pattern matcher of Byt patterns, built once as an
+    Aho-Corasick automaton so that a buffer is scanned in one pass,
+    whatever the number of patterns
+
+    Matches are reported as (offset, index) tuples, index being the
+    position of the pattern in the patterns attribute; overlapping
+    matches are all reported, ordered by ending offset.
+
+    >>> ps = PatternSet([Byt('he'), Byt('she'), Byt('hers')])
+    >>> list(ps.finditer(Byt('ushers')))
+    [(1, 1), (2, 0), (2, 2)]
+    """
+    def __init__(self, patterns):
+        self.patterns = []
+        for pattern in patterns:
+            if isinstance(pattern, BytView):
+                pattern = pattern.byt()
+            if not isinstance(pattern, Byt):
+                raise TypeError("can't search {}"\
+                        .format(type(pattern).__name__))
+            if len(pattern) == 0:
+                raise ValueError("can't search empty patterns")
+            self.patterns.append(pattern)
+        self._lengths = [len(pattern) for pattern in self.patterns]
+        self._compile()
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self.patterns)
+
+    def _compile(self):
+        # trie
+        goto = [{}]
+        out = [[]]
+        for idx, pattern in enumerate(self.patterns):
+            state = 0
+            for c in pattern.iterInts():
+                if c not in goto[state]:
+                    goto.append({})
+                    out.append([])
+                    goto[state][c] = len(goto) - 1
+                state = goto[state][c]
+            out[state].append(idx)
+        # failure links, breadth-first, merged into a complete automaton
+        delta = [None] * len(goto)
+        delta[0] = [goto[0].get(c, 0) for c in range(256)]
+        fail = [0] * len(goto)
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            row = list(delta[fail[state]])
+            for c, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]][c]
+                row[c] = nxt
+                queue.append(nxt)
+            delta[state] = row
+            out[state] = out[state] + out[fail[state]]
+        # accepting states are numbered last, shifted by 8 bits so that
+        # a transition costs a single addition and list lookup
+        states = [0] + order
+        states.sort(key=lambda state: len(out[state]) > 0)
+        rank = [0] * len(goto)
+        for idx, state in enumerate(states):
+            rank[state] = idx << 8
+        self._table = [rank[nxt] for state in states for nxt in delta[state]]
+        self._accept = (len(states) - sum(1 for s in states if out[s])) << 8
+        self._outs = [out[state] for state in states if out[state]]
+
+    def finditer(self, value):
+        """
+        Returns the iterator of the (offset, index) tuples of all the
+        matches in a Byt or BytView
+        """
+        table = self._table
+        accept = self._accept
+        outs = self._outs
+        lengths = self._lengths
+        state = 0
+        for pos, c in enumerate(_codes(value)):
+            state = table[state + c]
+            if state >= accept:
+                for idx in outs[(state - accept) >> 8]:
+                    yield pos - lengths[idx] + 1, idx
+
+    def count(self, value):
+        """
+        Returns the total number of matches in a Byt or BytView
+        """
+        table = self._table
+        accept = self._accept
+        counts = [len(out) for out in self._outs]
+        res = 0
+        state = 0
+        for c in _codes(value):
+            state = table[state + c]
+            if state >= accept:
+                res += counts[(state - accept) >> 8]
+        return res
+
+    def first(self, value):
+        """
+        Returns the (offset, index) tuple of the first match to end in
+        a Byt or BytView, or None
+        """
+        for match in self.finditer(value):
+            return match
+        return None
+
+
+class HexPattern(object):
+    """Byte-level pattern, written in the space-separated hexadecimal
+    format of Byt.hex and Byt.fromHex, with the additional tokens:
+
+    * '??' or '..': any octet
+    * '4?' or '?4': octet with the given high or low nibble
+    * '*': any number of any octets, as few as possible
+    * '{n}', '{n,}' or '{n,m}' suffix: repetition of the token
+
+    It is translated once into a compiled bytes regular expression;
+    matches are returned as (start, end) offsets.
+
+    >>> p = compileHexPattern('7E ?? 01 4? ..{2} 7E')
+    >>> p.search(Byt.fromHex('00 7e aa 01 42 00 00 7e'))
+    (1, 8)
+    """
+    def __init__(self, pattern):
+        self.pattern = pattern
+        parts = []
+        for token in pattern.split():
+            if token == '*':
+                parts.append('.*?')
+                continue
+            found = _TOKEN.match(token)
+            if found is None:
+                raise ValueError("invalid hex pattern token {}".format(token))
+            core = found.group('core')
+            rep = found.group('rep') or ''
+            if core in ('??', '..'):
+                part = '.'
+            elif core[0] == '?':
+                low = int(core[1], 16)
+                part = '[' + ''.join('\\x{:02x}'.format(high << 4 | low)
+                                     for high in range(16)) + ']'
+            elif core[1] == '?':
+                high = int(core[0], 16) << 4
+                part = '[\\x{:02x}-\\x{:02x}]'.format(high, high | 15)
+            else:
+                part = ''.join('\\x' + core[i:i+2]
+                               for i in range(0, len(core), 2))
+                if len(core) > 2 and rep:
+                    part = '(?:' + part + ')'
+            parts.append(part + rep)
+        self.regex = re_compile(''.join(parts).encode('ascii'), DOTALL)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, repr(self.pattern))
+
+    def search(self, value, pos=0, endpos=None):
+        """
+        Returns the (start, end) offsets of the first match in a Byt or
+        BytView, or None
+        """
+        buf = _buffer(value)
+        found = self.regex.search(buf, pos, len(buf) if endpos is None
+                                  else endpos)
+        return None if found is None else found.span()
+
+    def match(self, value, pos=0, endpos=None):
+        """
+        Returns the (start, end) offsets of the match starting at pos in
+        a Byt or BytView, or None
+        """
+        buf = _buffer(value)
+        found = self.regex.match(buf, pos, len(buf) if endpos is None
+                                 else endpos)
+        return None if found is None else found.span()
+
+    def finditer(self, value, pos=0, endpos=None):
+        """
+        Returns the iterator of the (start, end) offsets of the
+        successive non-overlapping matches in a Byt or BytView
+        """
+        buf = _buffer(value)
+        for found in self.regex.finditer(buf, pos, len(buf) if endpos is None
+                                         else endpos):
+            yield found.span()
+
+
+def compileHexPattern(pattern):
+    """
+    Returns the compiled HexPattern of a hexadecimal pattern string,
+    e.g. '7E ?? 01 4? .. 7E'
+    """
+    return HexPattern(pattern)
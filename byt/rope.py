@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from .byt import Byt, BytView, PYTHON3
+
+
+__all__ = ["BytRope"]
+
+
+# maximum number of buffers given to a single sendmsg call
+_IOV_MAX = 1024
+
+
+class BytRope(object):
+    """Lazy concatenation of Byt, BytView or BytRope segments
+
+    Concatenating ropes costs O(1): the segments are recorded as a tree
+    and only flattened into a Byt (or cls) instance when the octets are
+    needed, e.g. for hashing or comparing; the result is then cached.
+    The segments can also be written without flattening, see writeTo.
+
+    >>> r = BytRope([Byt('ab')]) + Byt('cd')
+    >>> r += Byt('xefx').view(1, 3)
+    >>> len(r)
+    6
+    >>> r.byt()
+    Byt('abcdef')
+    """
+    __slots__ = ('_parts', '_len', '_cls', '_flat')
+
+    def __init__(self, parts=(), cls=Byt):
+        self._parts = tuple(parts)
+        length = 0
+        for part in self._parts:
+            if not isinstance(part, (Byt, BytView, BytRope)):
+                raise TypeError("can't concat {} to {}"\
+                        .format(type(part).__name__, type(self).__name__))
+            length += len(part)
+        self._len = length
+        self._cls = cls
+        self._flat = None
+
+    def __len__(self):
+        return self._len
+
+    def __add__(self, other):
+        return BytRope((self, other), self._cls)
+
+    def __radd__(self, other):
+        return BytRope((other, self), self._cls)
+
+    def segments(self):
+        """
+        Returns the iterator of the Byt and BytView leaves of the rope,
+        in order
+        """
+        stack = [iter(self._parts)]
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, BytRope):
+                    if part._flat is not None:
+                        yield part._flat
+                    else:
+                        stack.append(iter(part._parts))
+                        break
+                else:
+                    yield part
+            else:
+                stack.pop()
+
+    def buffers(self):
+        """
+        Returns the list of the buffers of the segments, without copy
+        """
+        res = []
+        for seg in self.segments():
+            if isinstance(seg, BytView):
+                seg = seg.memview() if PYTHON3 else seg.memview().tobytes()
+            if len(seg):
+                res.append(seg)
+        return res
+
+    def byt(self):
+        """
+        Flattens the rope into a Byt (or cls) instance, computed once
+        """
+        if self._flat is None:
+            self._flat = self._cls(b''.join(self.buffers()))
+        return self._flat
+
+    def writeTo(self, fileobj):
+        """
+        Writes the segments to a socket, with scatter sendmsg calls
+        (sendall per segment where sendmsg is missing, as on python 2),
+        or to a file-like object, one segment at a time; returns the
+        number of octets written
+        """
+        bufs = self.buffers()
+        if not hasattr(fileobj, 'sendmsg'):
+            write = getattr(fileobj, 'sendall', None) or fileobj.write
+            for buf in bufs:
+                write(buf)
+            return self._len
+        bufs = [memoryview(buf) for buf in bufs]
+        idx = 0
+        while idx < len(bufs):
+            sent = fileobj.sendmsg(bufs[idx:idx + _IOV_MAX])
+            # skips the buffers fully sent, slices the partial one
+            while idx < len(bufs) and sent >= len(bufs[idx]):
+                sent -= len(bufs[idx])
+                idx += 1
+            if sent:
+                bufs[idx] = bufs[idx][sent:]
+        return self._len
+
+    def str(self):
+        """
+        Returns an ISO-8859-1/ASCII representation of the octets
+        """
+        return self.byt().str()
+
+    def hex(self, sep=' ', group=1, upper=False):
+        """
+        Returns a hexadecimal representation of the bytes-chain,
+        with a sep separator every group octets, in upper or lower case
+        """
+        return self.byt().hex(sep, group, upper)
+
+    def __str__(self):
+        return str(self.byt())
+
+    def __repr__(self):
+        return "{}([{}])".format(self.__class__.__name__, repr(self.byt()))
+
+    def __eq__(self, other):
+        if isinstance(other, BytRope):
+            return len(self) == len(other) and self.byt() == other.byt()
+        return self.byt() == other
+
+    def __ne__(self, other):
+        res = self.__eq__(other)
+        return res if res is NotImplemented else not res
+
+    def __hash__(self):
+        return hash(self.byt())
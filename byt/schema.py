@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from array import array
+from collections import namedtuple
+from collections import OrderedDict
+from keyword import iskeyword
+from re import compile as re_compile
+from struct import calcsize
+from struct import error as StructError
+
+from .byt import Byt, BytView, PYTHON3, _struct
+
+
+__all__ = ["Schema"]
+
+
+# struct codes of the integer and float field types
+_CODES = {'u8': 'B', 'u16': 'H', 'u32': 'I', 'u64': 'Q',
+          'i8': 'b', 'i16': 'h', 'i32': 'i', 'i64': 'q',
+          'f32': 'f', 'f64': 'd'}
+# struct codes holding bit-field groups, by number of bits
+_BITCODES = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
+_NAME = re_compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+
+
+def _typecode(code):
+    """
+    Returns the array typecode matching a struct code, or None
+    """
+    if code in 'fd':
+        return code
+    size = calcsize('=' + code)
+    for tc in ('bhilq' if code.islower() else 'BHILQ'):
+        try:
+            if array(tc).itemsize == size:
+                return tc
+        except ValueError:  # no 'q' on python2
+            pass
+    return None
+
+
+class Schema(object):
+    """Compiled binary record layout, decoding and encoding Byt records
+
+    The fields are (name, type) pairs, with type among:
+
+    * 'u8', 'u16', 'u32', 'u64', 'i8', 'i16', 'i32', 'i64', 'f32', 'f64'
+    * 'bytes:N': fixed-length Byt of N octets
+    * 'bits:N': N-bit unsigned integer, most significant bits first;
+      consecutive bit fields must add up to 8, 16, 32 or 64 bits, and
+      are truncated to their width when encoding
+    * 'len-prefixed' or 'len-prefixed:uX': Byt preceded by its length,
+      as an unsigned integer (u16 by default)
+
+    The layout is compiled once into specialised decoding and encoding
+    functions, generated from the fields.
+
+    >>> s = Schema([('id', 'u16'), ('flags', 'bits:3'), ('kind', 'bits:5'),
+    ...             ('payload', 'len-prefixed:u8')])
+    >>> b = s.encode(1, 2, 3, Byt('hi'))
+    >>> b.hex()
+    '00 01 43 02 68 69'
+    >>> s.decode(b)
+    Record(id=1, flags=2, kind=3, payload=Byt('hi'))
+    """
+    def __init__(self, fields, byteorder='>', name='Record'):
+        if byteorder not in ('<', '>', '!', '='):
+            raise ValueError("unknown byteorder {}".format(byteorder))
+        self.fields = tuple((str(fname), str(ftype))
+                            for fname, ftype in fields)
+        self.byteorder = byteorder
+        names = [fname for fname, ftype in self.fields]
+        for fname in names:
+            if not _NAME.match(fname) or iskeyword(fname):
+                raise ValueError("invalid field name {}".format(fname))
+        if len(set(names)) != len(names):
+            raise ValueError("duplicate field names")
+        self.names = tuple(names)
+        self.Record = namedtuple(name, names)
+        self._ops = self._parse()
+        self.size = None
+        if all(op[0] == 'struct' for op in self._ops):
+            self.size = sum(_struct(op[1]).size for op in self._ops)
+        self._compile()
+
+    def _parse(self):
+        """
+        Groups the fields into struct runs and length-prefixed Byt
+        """
+        ops = []
+        run = None
+        bits = None
+        for fname, ftype in self.fields:
+            kind, _, arg = ftype.partition(':')
+            if kind == 'bits':
+                width = int(arg)
+                if width < 1:
+                    raise ValueError("invalid bit width {}".format(ftype))
+                if bits is None:
+                    bits = []
+                bits.append((fname, width))
+                if sum(w for n, w in bits) > 64:
+                    raise ValueError("bit fields exceed 64 bits")
+                continue
+            if bits is not None:
+                run = self._close_bits(ops, run, bits)
+                bits = None
+            if kind == 'len-prefixed':
+                lencode = _CODES.get(arg or 'u16')
+                if lencode is None or lencode not in 'BHIQ':
+                    raise ValueError("invalid length type {}".format(ftype))
+                ops.append(('prefixed', self.byteorder + lencode, fname))
+                run = None
+                continue
+            if kind == 'bytes':
+                size = int(arg)
+                if size < 1:
+                    raise ValueError("invalid bytes size {}".format(ftype))
+                item = ('bytes', '{}s'.format(size), fname, size)
+            elif ftype in _CODES:
+                item = ('int', _CODES[ftype], fname)
+            else:
+                raise ValueError("unknown field type {}".format(ftype))
+            if run is None:
+                run = []
+                ops.append(('struct', run))
+            run.append(item)
+        if bits is not None:
+            self._close_bits(ops, run, bits)
+        # struct runs are compiled into a single format
+        return [('struct', self.byteorder + ''.join(it[1] for it in op[1]),
+                 op[1]) if op[0] == 'struct' else op for op in ops]
+
+    def _close_bits(self, ops, run, bits):
+        total = sum(w for n, w in bits)
+        if total not in _BITCODES:
+            raise ValueError("bit fields must add up to 8, 16, 32 or 64 "
+                             "bits, got {}".format(total))
+        if run is None:
+            run = []
+            ops.append(('struct', run))
+        run.append(('bits', _BITCODES[total], bits, total))
+        return run
+
+    def _compile(self):
+        """
+        Generates the source of the decoding and encoding functions
+        """
+        # builtins are bound under reserved names, fields may shadow them
+        ns = {'_Byt': Byt, '_StructError': StructError, '_rec': self.Record,
+              '_len': len, '_isinstance': isinstance, '_type': type,
+              '_TypeError': TypeError, '_ValueError': ValueError}
+        dec = ["def _decode(_mv, _pos, _cls, _end):"]
+        enc_checks = []
+        enc = []
+        for idx, op in enumerate(self._ops):
+            st = '_s{}'.format(idx)
+            ns[st] = _struct(op[1])
+            if op[0] == 'prefixed':
+                fname = op[2]
+                dec.append("    _n, = {}.unpack_from(_mv, _pos)".format(st))
+                dec.append("    _pos += {}".format(ns[st].size))
+                dec.append("    if _pos + _n > _end:")
+                dec.append("        raise _StructError('truncated field {}')"
+                           .format(fname))
+                dec.append("    {} = _cls({})".format(
+                    fname, "_mv[_pos:_pos + _n]" if PYTHON3
+                    else "_mv[_pos:_pos + _n].tobytes()"))
+                dec.append("    _pos += _n")
+                enc_checks.append(fname)
+                enc.append("{}.pack(_len({}))".format(st, fname))
+                enc.append(fname)
+                continue
+            slots = ['_v{}_{}'.format(idx, i) for i in range(len(op[2]))]
+            dec.append("    {}, = {}.unpack_from(_mv, _pos)"
+                       .format(', '.join(slots), st))
+            dec.append("    _pos += {}".format(ns[st].size))
+            args = []
+            for slot, item in zip(slots, op[2]):
+                if item[0] == 'int':
+                    dec.append("    {} = {}".format(item[2], slot))
+                    args.append(item[2])
+                elif item[0] == 'bytes':
+                    dec.append("    {} = _cls({})".format(item[2], slot))
+                    enc_checks.append(item[2])
+                    args.append(item[2])
+                    ns['_size_' + item[2]] = item[3]
+                else:
+                    shift = item[3]
+                    parts = []
+                    for fname, width in item[2]:
+                        shift -= width
+                        mask = (1 << width) - 1
+                        dec.append("    {} = {} >> {} & {}"
+                                   .format(fname, slot, shift, mask))
+                        parts.append("({} & {}) << {}"
+                                     .format(fname, mask, shift))
+                    args.append(' | '.join(parts))
+            enc.append("{}.pack({})".format(st, ', '.join(args)))
+        dec.append("    return _rec({}), _pos".format(', '.join(self.names)))
+        src = ["def _encode({}):".format(', '.join(self.names))]
+        for fname in enc_checks:
+            src.append("    if not _isinstance({}, _Byt):".format(fname))
+            src.append("        raise _TypeError(\"can't encode {{}} as {}\""
+                       ".format(_type({}).__name__))".format(fname, fname))
+            if '_size_' + fname in ns:
+                src.append("    if _len({}) != _size_{}:"
+                           .format(fname, fname))
+                src.append("        raise _ValueError('wrong size of {}')"
+                           .format(fname))
+        src.append("    return b''.join([{}])".format(', '.join(enc)))
+        self.source = '\n'.join(dec) + '\n\n\n' + '\n'.join(src) + '\n'
+        exec(compile(self.source, '<byt.Schema>', 'exec'), ns)
+        self._decode = ns['_decode']
+        self._encode = ns['_encode']
+
+    @staticmethod
+    def _buffer(value):
+        if isinstance(value, BytView):
+            return value.memview(), value._cls
+        elif isinstance(value, Byt):
+            return memoryview(value), type(value)
+        raise TypeError("can't decode {}".format(type(value).__name__))
+
+    def decode(self, value, offset=0):
+        """
+        Returns the record read from offset in a Byt or BytView
+        """
+        mv, cls = self._buffer(value)
+        return self._decode(mv, offset, cls, len(mv))[0]
+
+    def decodeFrom(self, value, offset=0):
+        """
+        Returns the record read from offset in a Byt or BytView, and the
+        offset following the record
+        """
+        mv, cls = self._buffer(value)
+        return self._decode(mv, offset, cls, len(mv))
+
+    def iterDecode(self, value, offset=0):
+        """
+        Returns the iterator of the consecutive records of a Byt or
+        BytView, from offset to the end
+        """
+        mv, cls = self._buffer(value)
+        end = len(mv)
+        decode = self._decode
+        while offset < end:
+            rec, offset = decode(mv, offset, cls, end)
+            yield rec
+
+    def decodeColumns(self, value, offset=0):
+        """
+        Returns the ordered dictionary of the columns of the consecutive
+        records of a Byt or BytView: array for the integer and float
+        fields, list otherwise
+        """
+        mv, cls = self._buffer(value)
+        if PYTHON3 and self.size is not None and len(self._ops) == 1:
+            # fixed layout, bulk unpacking
+            rows = _struct(self._ops[0][1]).iter_unpack(mv[offset:])
+            raw = list(zip(*rows))
+        else:
+            raw = None
+        if raw is None:
+            cols = list(zip(*self.iterDecode(value, offset)))
+            cols = cols or [()] * len(self.names)
+            res = OrderedDict(zip(self.names, cols))
+        else:
+            raw = raw or [()] * len(self._ops[0][2])
+            res = OrderedDict()
+            for col, item in zip(raw, self._ops[0][2]):
+                if item[0] == 'int':
+                    res[item[2]] = col
+                elif item[0] == 'bytes':
+                    res[item[2]] = [cls(v) for v in col]
+                else:
+                    shift = item[3]
+                    for fname, width in item[2]:
+                        shift -= width
+                        mask = (1 << width) - 1
+                        res[fname] = [v >> shift & mask for v in col]
+        for fname, ftype in self.fields:
+            code = _CODES.get(ftype)
+            if ftype.startswith('bits'):
+                width = int(ftype.partition(':')[2])
+                code = _BITCODES[min(b for b in _BITCODES if b >= width)]
+            tc = _typecode(code) if code is not None else None
+            if tc is not None:
+                res[fname] = array(tc, res[fname])
+            else:
+                res[fname] = list(res[fname])
+        return res
+
+    def encode(self, *args, **kwargs):
+        """
+        Returns the Byt encoding of a record, given as positional or
+        keyword field values
+        """
+        return Byt(self._encode(*args, **kwargs))
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, list(self.fields))
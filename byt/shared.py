@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from multiprocessing import parent_process
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from os import name as os_name
+
+from .byt import Byt, BytView
+
+
+__all__ = ["SharedByt", "share"]
+
+
+# names of the blocks created by this process, tracked until unlinked
+_OWNED = set()
+
+
+def _attach(name, size, cls):
+    """
+    Returns the SharedByt of an existing shared memory block, as
+    unpickled in other processes
+    """
+    try:
+        # the creating process keeps the block tracked (python 3.13+)
+        shm = SharedMemory(name, track=False)
+    except TypeError:
+        shm = SharedMemory(name)
+        # attaching also tracked the block (python < 3.13): the tracker of
+        # a process not started by multiprocessing would destroy it at exit
+        if name not in _OWNED and parent_process() is None \
+                and os_name == 'posix':
+            resource_tracker.unregister('/' + name, 'shared_memory')
+    return SharedByt(shm, size, cls)
+
+
+class SharedByt(object):
+    """Byt or DByt data held in a multiprocessing shared memory block
+
+    Created by share, it pickles as the name of its block only, so it is
+    passed to process pools for the cost of a handle; workers read the
+    octets in place through view. The creating process should unlink
+    the block once the workers are done, or use the SharedByt as a
+    context manager. Requires python 3.8+, this module is not imported
+    by the byt package.
+
+    >>> s = share(Byt('hello'))
+    >>> s.view()
+    BytView(Byt('hello'))
+    >>> s.close(); s.unlink()
+    """
+    def __init__(self, shm, size, cls=Byt, owner=False):
+        self._shm = shm
+        self._size = size
+        self._cls = cls
+        self._owner = owner
+        self._buf = None
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory block
+        """
+        return self._shm.name
+
+    def __len__(self):
+        return self._size
+
+    def view(self):
+        """
+        Returns a zero-copy BytView of the shared octets; it is released
+        by closing the SharedByt, not the view
+        """
+        if self._buf is None:
+            self._buf = self._shm.buf[:self._size]
+        return BytView(self._buf, cls=self._cls)
+
+    def byt(self):
+        """
+        Returns a copy of the shared octets, as a Byt or DByt
+        """
+        return self.view().byt()
+
+    def close(self):
+        """
+        Detaches the shared memory block from this process; no view
+        should be used afterwards
+        """
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Destroys the shared memory block, once all processes closed it
+        """
+        self._shm.unlink()
+        _OWNED.discard(self.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self):
+        return _attach, (self.name, self._size, self._cls)
+
+    def __repr__(self):
+        return "{}('{}', {} octets)".format(self.__class__.__name__,
+                                            self.name, self._size)
+
+
+def share(value):
+    """
+    Returns the SharedByt of a Byt, DByt or BytView, copied once into a
+    new shared memory block owned by the calling process
+    """
+    if isinstance(value, BytView):
+        cls, buf = value._cls, value.memview()
+    elif isinstance(value, Byt):
+        cls, buf = type(value), value
+    else:
+        raise TypeError("can't share {}".format(type(value).__name__))
+    size = len(buf)
+    # empty blocks are not allowed
+    shm = SharedMemory(create=True, size=max(size, 1))
+    shm.buf[:size] = buf
+    _OWNED.add(shm.name)
+    return SharedByt(shm, size, cls, owner=True)
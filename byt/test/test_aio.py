@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from nose.tools import raises
+from ..byt import Byt, DByt, PYTHON3
+from ..framer import DelimiterFramer, LengthFramer
+if PYTHON3:
+    import asyncio
+    from ..aio import BytReader, BytFrames
+
+
+def _reader(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+def _collect(loop, frames):
+    res = []
+    while True:
+        try:
+            res.append(loop.run_until_complete(frames.__anext__()))
+        except StopAsyncIteration:
+            return res
+
+def test_reader():
+    if not PYTHON3:
+        return
+    loop = asyncio.new_event_loop()
+    r = BytReader(_reader(b'abc;defg\nhij'))
+    res = [loop.run_until_complete(r.readbyt(2)),
+           loop.run_until_complete(r.readuntil(Byt(';'))),
+           loop.run_until_complete(r.readline()),
+           loop.run_until_complete(r.read())]
+    assert res == [Byt('ab'), Byt('c;'), Byt('defg\n'), Byt('hij')]
+    assert all(type(item) is Byt for item in res)
+    assert r.at_eof()
+    r = BytReader(_reader(b'ab'), DByt)
+    assert type(loop.run_until_complete(r.read())) is DByt
+    loop.close()
+
+def test_frames():
+    if not PYTHON3:
+        return
+    loop = asyncio.new_event_loop()
+    frames = BytFrames(_reader(b'a;bc;;d'), DelimiterFramer(Byt(';')), 2)
+    assert _collect(loop, frames) == [Byt('a'), Byt('bc'), Byt()]
+    framer = LengthFramer('B', cls=DByt)
+    frames = BytReader(_reader(b'\x01a\x02bc\x00')).frames(framer)
+    res = _collect(loop, frames)
+    assert res == [Byt('a'), Byt('bc'), Byt()]
+    assert type(res[0]) is DByt
+    assert frames is frames.__aiter__()
+    loop.close()
+
+@raises(TypeError)
+def test_wrong_readuntil():
+    if not PYTHON3:
+        raise TypeError
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(BytReader(_reader(b'a;')).readuntil(b';'))
+    finally:
+        loop.close()
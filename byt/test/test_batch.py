@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from nose.tools import raises
+from ..byt import Byt, DByt, BytView
+from .. import batch
+
+
+RECORDS = [Byt('ab'), Byt(), Byt('cde'), Byt('\x00\xff')]
+
+
+def test_pack():
+    p = batch.pack(RECORDS)
+    assert len(p) == 4
+    assert p.buffer == Byt('abcde\x00\xff')
+    assert p.offsets.tolist() == [0, 2, 2, 5, 7]
+    assert isinstance(p[0], BytView)
+    assert p[2] == Byt('cde') and p[-1] == Byt('\x00\xff')
+    assert list(p)[1] == Byt()
+    assert p.byts() == RECORDS
+    assert batch.pack(p) is p
+    assert len(batch.pack([])) == 0
+    assert type(batch.pack([DByt('a')]).buffer) is DByt
+
+def test_hex():
+    res = [b.hex() for b in RECORDS]
+    assert batch.hex(RECORDS) == res
+    assert batch.hex(batch.pack(RECORDS)) == res
+    assert batch.hex(iter(RECORDS), sep='') == [b.hex('') for b in RECORDS]
+    assert batch.hex(RECORDS, sep=':', upper=True) ==\
+        [b.hex(':', upper=True) for b in RECORDS]
+    assert batch.hex(RECORDS, sep='--') == [b.hex('--') for b in RECORDS]
+    assert batch.hex(RECORDS, group=2) == [b.hex(group=2) for b in RECORDS]
+    assert batch.hex([]) == []
+
+def test_equal():
+    assert batch.equal(RECORDS, RECORDS) == [True] * 4
+    assert batch.equal(RECORDS, [Byt('ab'), Byt('x'), DByt('cde'),
+                                 Byt()]) == [True, False, True, False]
+    assert batch.equal(batch.pack(RECORDS), Byt('cde')) ==\
+        [False, False, True, False]
+
+def test_find():
+    sub = Byt('d')
+    res = [b.find(sub) for b in RECORDS]
+    assert batch.find(RECORDS, sub) == res == [-1, -1, 1, -1]
+    assert batch.find(batch.pack(RECORDS), sub) == res
+    # matches across records are not found in packed batches
+    assert batch.find(batch.pack(RECORDS), Byt('bc')) == [-1] * 4
+    assert batch.find(batch.pack(RECORDS), Byt()) == [0] * 4
+
+def test_sort():
+    assert batch.sort(RECORDS) == sorted(RECORDS)
+    assert batch.sort(RECORDS, reverse=True) ==\
+        sorted(RECORDS, reverse=True)
+    assert batch.sort(RECORDS, key=len) == sorted(RECORDS, key=len)
+    records = [Byt('b1'), Byt('a2'), Byt('c0'), Byt('d1')]
+    assert batch.sort(records, key=slice(1, None)) ==\
+        [Byt('c0'), Byt('b1'), Byt('d1'), Byt('a2')]
+    assert batch.sort(batch.pack(records), key=slice(0, 1)) ==\
+        sorted(records)
+
+@raises(TypeError)
+def test_wrong_batch():
+    batch.hex([Byt('a'), b'a'])
+
+@raises(TypeError)
+def test_wrong_sub():
+    batch.find(RECORDS, 'a')
+
+@raises(ValueError)
+def test_wrong_lengths():
+    batch.equal(RECORDS, RECORDS[1:])
+
+@raises(IndexError)
+def test_wrong_index():
+    batch.pack(RECORDS)[4]
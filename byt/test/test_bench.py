@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+import json
+import os
+from tempfile import mkstemp
+from nose.tools import raises
+from ..bench import OPERATIONS, run, main
+
+
+def test_run():
+    report = run(sizes=(1, 40), repeat=1, mintime=0)
+    assert len(report["results"]) == 2 * len(OPERATIONS)
+    for res in report["results"]:
+        assert res["operation"] in OPERATIONS
+        assert res["size"] in (1, 40)
+        assert res["byt"] >= 0 and res["bytes"] >= 0
+    assert json.loads(json.dumps(report)) == report
+
+def test_main():
+    fd, path = mkstemp()
+    os.close(fd)
+    try:
+        report = main(["--sizes", "16", "--operations", "hex,split",
+                       "--repeat", "1", "--mintime", "0", "--json", path])
+        with open(path) as f:
+            assert json.load(f) == report
+        assert [res["operation"] for res in report["results"]] ==\
+            ["hex", "split"]
+    finally:
+        os.remove(path)
+
+@raises(ValueError)
+def test_wrong_operation():
+    run(sizes=(1,), operations=("nope",))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from nose.tools import raises
+from ..byt import Byt, DByt
+from ..bits import BitReader, BitWriter
+
+
+def test_bitreader_msb():
+    r = BitReader(Byt(0b10110010, 0xff, 0x01))
+    assert r.peek(3) == 5
+    assert r.read(3) == 5
+    assert r.tell() == 3
+    assert r.read(5) == 0b10010
+    assert r.readSigned(4) == -1
+    assert r.remaining() == 12
+    r.align()
+    assert r.tell() == 16
+    assert r.read(8) == 1
+    assert r.remaining() == 0
+
+def test_bitreader_lsb():
+    r = BitReader(Byt(0b10110010, 0xff).view(), 'lsb')
+    assert r.read(3) == 0b010
+    assert r.read(5) == 0b10110
+    assert r.read(8) == 0xff
+
+def test_bitreader_words():
+    data = Byt(list(range(20)))
+    r = BitReader(data)
+    assert r.read(4) == 0
+    r.skip(68)
+    assert r.tell() == 72
+    assert r.read(8) == 9
+    assert r.read(80) == int(data[10:20].hex(''), 16)
+    r = BitReader(data)
+    r.skip(4)
+    assert r.readByt(3) == Byt(0x00, 0x10, 0x20)
+    r.align()
+    assert r.readByt(2) == Byt(4, 5)
+
+def test_bitwriter():
+    for order in ('msb', 'lsb'):
+        w = BitWriter(order)
+        w.write(5, 3)
+        w.writeSigned(-3, 7)
+        w.align()
+        w.writeByt(DByt('ab'))
+        w.write(2 ** 70 + 1, 71)
+        w.write(1, 1)
+        assert w.tell() == 16 + 16 + 72
+        r = BitReader(w.byt(), order)
+        assert r.read(3) == 5
+        assert r.readSigned(7) == -3
+        r.align()
+        assert r.readByt(2) == Byt('ab')
+        assert r.read(71) == 2 ** 70 + 1
+        assert r.read(1) == 1
+    w = BitWriter()
+    w.write(1, 1)
+    assert w.byt() == Byt(0x80)
+    w = BitWriter('lsb')
+    w.write(1, 1)
+    assert w.byt() == Byt(0x01)
+    assert BitWriter().byt() == Byt()
+
+def test_bitwriter_aligned_byt():
+    for order in ('msb', 'lsb'):
+        w = BitWriter(order)
+        for i in range(20):
+            w.write(i, 8)
+            w.writeByt(Byt('ab'))
+        w.write(1, 1)
+        w.writeByt(Byt('c'))
+        ref = Byt().join([Byt(i) + Byt('ab') for i in range(20)])
+        assert w.byt()[:60] == ref
+        assert len(w.byt()) == 62 and w.tell() == 489
+
+@raises(EOFError)
+def test_bitreader_eof():
+    BitReader(Byt(1)).read(9)
+
+@raises(TypeError)
+def test_wrong_bitreader():
+    BitReader(b'a')
+
+@raises(ValueError)
+def test_wrong_bitwriter_value():
+    BitWriter().write(8, 3)
+
+@raises(ValueError)
+def test_wrong_bitwriter_signed():
+    BitWriter().writeSigned(4, 3)
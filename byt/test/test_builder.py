@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from nose.tools import raises
+from ..byt import Byt, DByt
+from ..builder import BytBuilder
+
+
+def test_builder():
+    b = BytBuilder()
+    assert len(b) == 0
+    assert b.byt() == Byt()
+    b += Byt('ab')
+    b.append(99)
+    b.append(DByt('d'))
+    assert b.write(Byt('ef')) == 2
+    b.extend([Byt('g'), 104])
+    b.write(Byt('xijx').view(1, 3))
+    assert len(b) == 10
+    assert b.byt() == Byt('abcdefghij')
+    assert type(b.byt()) is Byt
+    assert type(b.dbyt()) is DByt
+    assert b.capacity >= len(b)
+    b.clear()
+    assert len(b) == 0
+    assert b.byt() == Byt()
+
+def test_builder_capacity():
+    b = BytBuilder(4)
+    assert b.capacity == 4
+    b.reserve(2)
+    assert b.capacity == 4
+    b.reserve(100)
+    assert b.capacity == 100
+    for i in range(256):
+        b.append(i)
+    assert b.byt() == Byt(list(range(256)))
+
+@raises(TypeError)
+def test_wrong_builder_write():
+    BytBuilder().write(b'a')
+
+@raises(TypeError)
+def test_wrong_builder_iadd():
+    b = BytBuilder()
+    b += 'a'
+
+@raises(ValueError)
+def test_wrong_builder_append():
+    BytBuilder().append(256)
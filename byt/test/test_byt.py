@@ -25,8 +25,16 @@
 ###############################################################################
 
 
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+from array import array
+import os
+from tempfile import mkstemp
+from struct import error as StructError
 from nose.tools import raises
-from ..byt import Byt, DByt
+from ..byt import Byt, DByt, BytView, PYTHON3, setInternCache
 
 
 def test_creation_Byt():
@@ -54,6 +62,78 @@ def test_creation_DByt():
     assert DByt('abc').hex() == '61 62 63'
     assert DByt(DByt('aze')) == DByt('aze')
 
+def test_construction_fast_paths():
+    b = Byt('aze')
+    assert Byt(b) is b
+    assert type(DByt(b)) is DByt and DByt(b) == DByt('aze')
+    assert type(Byt(DByt('aze'))) is Byt
+    assert Byt(DByt('aze')).str() == 'aze'
+    assert Byt(DByt('aze'))[0] is Byt(97)
+    assert Byt(97) is Byt(97) and Byt(97) == Byt('a')
+    assert DByt(97) is DByt(97) and type(DByt(97)) is DByt
+    assert Byt(255) == Byt('\xff')
+    assert Byt(True) == Byt(1)
+    assert Byt(bytearray(b'az')) == Byt('az')
+    assert Byt(memoryview(b'az')) == Byt('az')
+    assert Byt.frombuffer(b'az') == Byt('az')
+    assert Byt.frombuffer(array('B', [97, 122])) == Byt('az')
+    assert type(DByt.frombuffer(b'az')) is DByt
+    assert Byt.fromints(array('B', [97, 122])) == Byt('az')
+    assert Byt.fromints(array('H', [97, 122])) == Byt('az')
+    assert Byt.fromints([97, 122]) == Byt('az')
+    assert Byt.fromints(i for i in (97, 122)) == Byt('az')
+    assert Byt.fromints([]) == Byt()
+
+def test_intern():
+    b = Byt('azeaze')
+    assert b[0] is b[3] is Byt(97)
+    assert list(b)[1] is b[4]
+    assert DByt('aa')[1] is DByt(97) and type(DByt('aa')[1]) is DByt
+    assert list(b.view())[0] is b[0]
+    assert Byt('a,b').split(Byt(','))[1] is Byt(98)
+    tokens = Byt('GET /a GET /b')
+    assert tokens.split()[0] is not tokens.split()[2]
+    setInternCache(maxsize=2, maxlength=3)
+    try:
+        assert tokens.split()[0] is tokens.rsplit()[2]
+        assert tokens.split()[0] == Byt('GET')
+        assert Byt('GET').intern() is tokens.split()[0]
+        assert type(DByt('GET').intern()) is DByt
+        assert Byt('GETS').intern() == Byt('GETS')
+        first = Byt('GET').intern()
+        Byt('PUT').intern()
+        Byt('DEL').intern()
+        assert Byt('GET').intern() is not first
+    finally:
+        setInternCache(maxsize=0)
+    assert Byt('GET').intern() is not Byt('GET').intern()
+
+def test_pickle():
+    import pickle
+    b = DByt('abc\x00')
+    b.byteset()
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        res = pickle.loads(pickle.dumps(b, protocol))
+        assert res == b and type(res) is DByt
+    if pickle.HIGHEST_PROTOCOL >= 5:
+        buffers = []
+        data = pickle.dumps(Byt('x' * 1000), 5,
+                            buffer_callback=buffers.append)
+        assert len(buffers) == 1 and len(data) < 1000
+        assert pickle.loads(data, buffers=buffers) == Byt('x' * 1000)
+
+@raises(ValueError)
+def test_wrong_single():
+    Byt(256)
+
+@raises(ValueError)
+def test_wrong_single2():
+    Byt(-1)
+
+@raises(TypeError)
+def test_wrong_frombuffer():
+    Byt.frombuffer([97, 122])
+
 def test_slice_iter():
     assert Byt('abc')[0] == Byt('a')
     assert Byt('abc')[-1] == Byt('c')
@@ -71,6 +151,63 @@ def test_slice_iter():
     assert [ch for ch in Byt('az')[0].iterInts()] == [97]
     assert [ch for ch in Byt('abc').iterInts()] == Byt('abc').ints()
 
+def test_file():
+    fd, path = mkstemp()
+    os.write(fd, b'hello world, hello!')
+    os.close(fd)
+    try:
+        assert Byt.fromFile(path) == Byt('hello world, hello!')
+        assert Byt.fromFile(path, 6, 5) == Byt('world')
+        assert type(DByt.fromFile(path, 6)) is DByt
+        m = Byt.mmap(path)
+        assert isinstance(m, BytView)
+        assert len(m) == 19
+        assert m == Byt('hello world, hello!')
+        assert m[0] == Byt('h')
+        assert m[6:11] == Byt('world')
+        assert m[::6] == Byt('hw !') and type(m[1::-1]) is Byt
+        assert m.find(Byt('hello'), 1) == 13
+        assert m.rfind(Byt('o')) == 17
+        assert m.count(Byt('hello')) == 2
+        assert m.count(Byt('l'), 4) == 3
+        assert m.count(Byt()) == 20
+        assert m.startswith(Byt('hello'))
+        assert not m.startswith(Byt('hello'), 1)
+        assert m.endswith(Byt('o!'))
+        assert m[6:].startswith(Byt('world'))
+        assert m[6:11].endswith(Byt('ld'))
+        assert Byt('world') in m
+        assert m[:5].hex() == '68 65 6c 6c 6f'
+        assert type(DByt.mmap(path).byt()) is DByt
+        assert Byt.mmap(path, 6, 5) == Byt('world')
+        m.close()
+    finally:
+        os.remove(path)
+    fd, path = mkstemp()
+    os.close(fd)
+    try:
+        assert Byt.mmap(path) == Byt()
+    finally:
+        os.remove(path)
+
+def test_bulk_ints():
+    b = Byt('abcde')
+    assert b.array() == array('B', [97, 98, 99, 100, 101])
+    assert b.view(1, 3).array() == array('B', [98, 99])
+    assert b.memview().tolist() == [97, 98, 99, 100, 101]
+    assert list(b.view(1).iterInts()) == [98, 99, 100, 101]
+    assert list(b.iterChunks(2)) == [Byt('ab'), Byt('cd'), Byt('e')]
+    assert type(list(DByt('abc').iterChunks(2))[0]) is DByt
+    assert list(b.view(1).iterChunks(3)) == [Byt('bcd'), Byt('e')]
+    assert list(Byt().iterChunks(3)) == []
+    try:
+        import numpy
+    except ImportError:
+        return
+    assert b.ndarray().tolist() == b.ints()
+    assert b.ndarray().dtype == numpy.uint8
+    assert b.view(2).ndarray().tolist() == [99, 100, 101]
+
 def test_str_concat():
     assert str(Byt('abc')) == 'abc'
     assert Byt('abc').str() == 'abc'
@@ -84,6 +221,48 @@ def test_str_concat():
     assert Byt('a') not in Byt('zcz')
     assert 1 not in Byt("12")
     assert 5 in Byt(1,5,3)
+    assert 256 not in Byt(1,5,3)
+    assert -1 not in Byt(255)
+    assert 255 in Byt(255)
+    assert 256 not in Byt(1,5,3).view()
+    assert 5 in Byt(1,5,3).view(1)
+
+def test_bitwise():
+    a = Byt(0x0f, 0xf0, 0x55)
+    b = DByt(0xff, 0x0f, 0x00)
+    assert a ^ b == Byt(0xf0, 0xff, 0x55)
+    assert a & b == Byt(0x0f, 0x00, 0x00)
+    assert a | b == Byt(0xff, 0xff, 0x55)
+    assert type(a ^ b) is Byt
+    assert type(b ^ a) is DByt
+    assert ~a == Byt(0xf0, 0x0f, 0xaa)
+    assert type(~b) is DByt
+    assert a << 4 == Byt(0xff, 0x05, 0x50)
+    assert a >> 4 == Byt(0x00, 0xff, 0x05)
+    assert a << 24 == Byt(0, 0, 0)
+    assert Byt() ^ Byt() == Byt()
+    assert ~Byt() == Byt()
+    assert Byt('hello').xorKey(Byt(1, 2)) == Byt('igmnn')
+    assert Byt('hello').xorKey(Byt(1, 2)).xorKey(Byt(1, 2)) == Byt('hello')
+    assert Byt().xorKey(Byt(1)) == Byt()
+
+def test_struct():
+    b = Byt.pack('>HBB', 0x6162, 0x63, 0x64)
+    assert b == Byt('abcd')
+    assert type(DByt.pack('>H', 1)) is DByt
+    assert b.unpack('>H') == (0x6162,)
+    assert b.unpack('>BH', 1) == (0x62, 0x6364)
+    assert list(b.iterUnpack('>H')) == [(0x6162,), (0x6364,)]
+    assert list(b.iterUnpack('B', 3)) == [(0x64,)]
+    assert b.view(1).unpack('>H', 1) == (0x6364,)
+    assert list(b.view(2).iterUnpack('<H')) == [(0x6463,)]
+
+def test_byteset():
+    b = Byt('abca')
+    assert b.byteset() == frozenset([97, 98, 99])
+    assert b.byteset() is b.byteset()
+    assert Byt().byteset() == frozenset()
+    assert not b.byteset().isdisjoint([1, 2, 99])
 
 def test_fct():
     assert Byt('abc').split() == [Byt('abc')]
@@ -146,6 +325,92 @@ def test_fct_compatibility():
 
 def test_fromhex():
     assert Byt.fromHex(Byt('hop').hex()) == Byt('hop')
+    assert Byt.fromHex('686f70') == Byt('hop')
+    assert Byt.fromHex('0x68 0X6f\n70\t') == Byt('hop')
+    assert DByt.fromHex('0x686f 70') == DByt('hop')
+    assert Byt.fromHex('') == Byt()
+
+def test_hexdump():
+    b = DByt('hello world!\n')
+    assert b.hexdump() == '00000000: 6865 6c6c 6f20 776f 726c 6421 0a  '\
+                         '       hello world!.'
+    assert list(b.iterHexdump(4, 1, 2, 5)) == ['00000002: 6c 6c 6f 20  llo ',
+                                              '00000006: 77           w']
+    assert DByt().hexdump() == ''
+    assert DByt('hello world!').hexdump(width=8, group=0) == \
+        '00000000: 68656c6c6f20776f  hello wo\n' \
+        '00000008: 726c6421          rld!'
+    f = StringIO()
+    assert DByt(list(range(40))).hexdump(f, 8, 4) is None
+    assert f.getvalue().splitlines() == \
+        list(DByt(list(range(40))).iterHexdump(8, 4))
+    assert len(f.getvalue().splitlines()) == 5
+
+def test_hex():
+    assert Byt().hex() == ''
+    assert Byt('abcde').hex('') == '6162636465'
+    assert Byt('abcde').hex(group=0) == '6162636465'
+    assert Byt('abcde').hex(':', 2) == '6162:6364:65'
+    assert Byt('abcde').hex('--', 2) == '6162--6364--65'
+    assert Byt('\xab\xcd').hex(upper=True) == 'AB CD'
+    assert Byt('ab\x00\xff').hex('x', upper=True) == '61x62x00xFF'
+    assert Byt('\xab\xcd').hex('-x-', upper=True) == 'AB-x-CD'
+    assert str(DByt('\xab\xcd')) == 'ab cd'
+    assert Byt('xabcx').view(1, 4).hex(':') == '61:62:63'
+    b = Byt(list(range(256)))
+    assert Byt.fromHex(b.hex()) == b
+    assert Byt.fromHex(b.hex('\n', 16, True)) == b
+
+def test_view():
+    b = Byt('hello world!')
+    v = b.view(6, 11)
+    assert isinstance(v, BytView)
+    assert len(v) == 5
+    assert v == Byt('world')
+    assert Byt('world') == v
+    assert v != Byt('hello')
+    assert v[0] == Byt('w')
+    assert v[-1] == Byt('d')
+    assert isinstance(v[1:3], BytView)
+    assert v[1:3] == Byt('or')
+    assert v[1:][1:] == Byt('rld')
+    assert v[::2] == Byt('wrd')
+    assert v.byt() == Byt('world')
+    assert type(v.byt()) is Byt
+    assert type(DByt('abc').view().byt()) is DByt
+    assert Byt(v) == Byt('world')
+    assert v.find(Byt('l')) == 3
+    assert v.find(Byt('h')) == -1
+    assert v.rfind(Byt('o')) == 1
+    assert v.count(Byt('o')) == 1
+    assert v.startswith(Byt('wo'))
+    assert not v.startswith(Byt('wo'), 1)
+    assert v.endswith(Byt('ld'))
+    assert Byt('o') in v
+    assert ord('h') not in v
+    assert v.ints() == [119, 111, 114, 108, 100]
+    assert [ch for ch in v[:2]] == [Byt('w'), Byt('o')]
+    assert v.hex() == '77 6f 72 6c 64'
+    assert str(v) == 'world'
+    assert hash(v) == hash(Byt('world'))
+    assert v.memview().tobytes() == b'world'
+    assert eval(repr(v)) == v
+    assert b.view(20) == Byt()
+
+def test_view_memoryview():
+    v = BytView(memoryview(bytearray(b'abcabca')), 1)
+    assert v == Byt('bcabca') and v[0] == Byt('b')
+    assert v.find(Byt('ca')) == 1 and v.find(Byt('ca'), 2) == 4
+    assert v.rfind(Byt('ca')) == 4 and v.rfind(Byt('x')) == -1
+    assert v.count(Byt('bca')) == 2 and v.count(Byt()) == 7
+    assert v[3:].startswith(Byt('bc')) and v.endswith(Byt('a'))
+    assert hash(v) == hash(Byt('bcabca'))
+
+@raises(ValueError)
+def test_wrong_view_memoryview():
+    if not PYTHON3:
+        raise ValueError
+    BytView(memoryview(b'abcdef')[::2])
 
 @raises(TypeError)
 def test_wrong_eq():
@@ -278,3 +543,39 @@ def test_wrong_endswith():
 @raises(TypeError)
 def test_wrong_startswith():
     Byt('abc').startswith(b'a')
+
+@raises(TypeError)
+def test_wrong_view():
+    BytView(b'abc')
+
+@raises(TypeError)
+def test_wrong_view_eq():
+    Byt('abc').view() == b'abc'
+
+@raises(TypeError)
+def test_wrong_view_find():
+    Byt('abc').view().find(b'a')
+
+@raises(IndexError)
+def test_wrong_view_index():
+    Byt('abc').view(1)[2]
+
+@raises(ValueError)
+def test_wrong_chunks():
+    list(Byt('abc').iterChunks(0))
+
+@raises(StructError)
+def test_wrong_iterunpack():
+    list(Byt('abc').iterUnpack('>H'))
+
+@raises(TypeError)
+def test_wrong_xor():
+    Byt('a') ^ b'a'
+
+@raises(ValueError)
+def test_wrong_xor_length():
+    Byt('a') ^ Byt('ab')
+
+@raises(TypeError)
+def test_wrong_xorkey():
+    Byt('a').xorKey(b'a')
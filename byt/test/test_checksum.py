@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from nose.tools import raises
+from ..byt import Byt, DByt
+from ..checksum import Crc8, Crc16Xmodem, Crc16Ccitt, Crc16Arc, \
+    Crc16Modbus, Crc32, Fletcher16, Fletcher32, Sum8, Xor8
+
+
+CHECK = Byt('123456789')
+ALL = (Crc8, Crc16Xmodem, Crc16Ccitt, Crc16Arc, Crc16Modbus, Crc32,
+       Fletcher16, Fletcher32, Sum8, Xor8)
+
+def test_check_values():
+    assert Crc8.compute(CHECK) == 0xf4
+    assert Crc16Xmodem.compute(CHECK) == 0x31c3
+    assert Crc16Ccitt.compute(CHECK) == 0x29b1
+    assert Crc16Arc.compute(CHECK) == 0xbb3d
+    assert Crc16Modbus.compute(CHECK) == 0x4b37
+    assert Crc32.compute(CHECK) == 0xcbf43926
+    assert Fletcher16.compute(Byt('abcde')) == 0xc8f0
+    assert Fletcher32.compute(Byt('abcde')) == 0xf04fc729
+    assert Fletcher32.compute(Byt('abcdef')) == 0x56502d2a
+    assert Sum8.compute(CHECK) == 0xdd
+    assert Xor8.compute(CHECK) == 0x31
+    assert Xor8.compute(Byt()) == 0
+
+def test_incremental():
+    data = DByt([(i * 31) % 256 for i in range(1001)])
+    for cls in ALL:
+        c = cls()
+        for chunk in (data[:1], data[1:10], data[10:513], data[513:]):
+            c.update(chunk)
+        assert c.value() == cls.compute(data), cls.__name__
+        partial = cls(data.view(0, 501))
+        copy = partial.copy()
+        partial.update(data.view(501))
+        assert partial.value() == c.value(), cls.__name__
+        copy.update(data[501:])
+        assert copy.value() == c.value(), cls.__name__
+
+def test_output():
+    c = Crc16Modbus(CHECK)
+    assert c.byt() == Byt(0x4b, 0x37)
+    assert c.hex() == '4b 37'
+    assert repr(c) == 'Crc16Modbus(0x4b37)'
+    assert Crc32(CHECK).byt() == Byt.fromHex('cb f4 39 26')
+    assert len(Crc8(CHECK).byt()) == 1
+
+@raises(TypeError)
+def test_wrong_checksum():
+    Crc32.compute(b'123')
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from ..byt import Byt, DByt
+from .. import fast
+
+
+def test_fast():
+    b = Byt(' a,bb,c ')
+    sep = Byt(',')
+    assert fast.find(b, sep) == b.find(sep) == 2
+    assert fast.rfind(b, sep) == b.rfind(sep)
+    assert fast.index(b, sep, 3) == b.index(sep, 3)
+    assert fast.count(b, sep) == b.count(sep) == 2
+    assert fast.startswith(b, Byt(' a'))
+    assert fast.endswith(b, Byt('c '))
+    assert fast.contains(b, Byt('bb'))
+    assert fast.eq(b, Byt(' a,bb,c ')) and fast.ne(b, Byt())
+    assert fast.add(b, sep) == b + sep
+    assert type(fast.add(DByt('a'), b)) is DByt
+    assert fast.split(b, sep) == b.split(sep)
+    assert fast.split(b, sep, 1) == b.split(sep, 1)
+    assert fast.rsplit(b, sep, 1) == b.rsplit(sep, 1)
+    assert all(type(part) is Byt for part in fast.split(b))
+    assert fast.strip(b) == b.strip()
+    assert fast.lstrip(b) == b.lstrip()
+    assert fast.rstrip(b, Byt(' c')) == b.rstrip(Byt(' c'))
+    assert fast.replace(b, sep, Byt(';')) == b.replace(sep, Byt(';'))
+    assert fast.replace(b, sep, Byt(), 1) == b.replace(sep, Byt(), 1)
+    assert fast.join(sep, [Byt('x'), Byt('y')]) == Byt('x,y')
+    assert type(fast.join(DByt(), [Byt('x')])) is DByt
+    assert fast.join(sep, []) == Byt()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from nose.tools import raises
+from ..byt import Byt, DByt
+from ..framer import DelimiterFramer, LengthFramer, CobsFramer, SlipFramer
+
+
+def test_delimiter_framer():
+    f = DelimiterFramer(Byt('\r\n'))
+    assert f.feed(Byt('ab\r')) == []
+    assert len(f) == 3
+    assert f.feed(Byt('\ncd\r\n\r\nef')) == [Byt('ab'), Byt('cd'), Byt()]
+    assert len(f) == 2
+    assert f.feed(Byt('g').view()) == []
+    assert f.feed(Byt('\r\n')) == [Byt('efg')]
+    assert len(f) == 0
+    assert f.encode(Byt('hi')) == Byt('hi\r\n')
+    f = DelimiterFramer(Byt(0), cls=DByt)
+    assert type(f.feed(Byt(1, 0))[0]) is DByt
+
+def test_delimiter_framer_bytewise():
+    f = DelimiterFramer(Byt(';'))
+    frames = []
+    for ch in Byt('a;bc;;def;g'):
+        frames += f.feed(ch)
+    assert frames == [Byt('a'), Byt('bc'), Byt(), Byt('def')]
+    assert len(f) == 1
+
+def test_length_framer():
+    f = LengthFramer('<I')
+    b = f.encode(Byt('hello')) + f.encode(Byt())
+    assert b[:4] == Byt(5, 0, 0, 0)
+    assert f.feed(b[:6]) == []
+    assert f.feed(b[6:]) == [Byt('hello'), Byt()]
+    assert len(f) == 0
+
+def test_cobs_framer():
+    f = CobsFramer()
+    payloads = [Byt('a'), Byt(0), Byt(0, 0), Byt(list(range(1, 256))),
+                Byt([7] * 254), Byt([7] * 254 + [0]), Byt([7] * 600)]
+    stream = Byt().join([f.encode(p) for p in payloads])
+    assert f.feed(stream) == payloads
+    assert f.feed(Byt(0, 0)) == []
+    assert f.feed(Byt(5, 1, 0)) == []
+    assert f.dropped == 1
+
+def test_slip_framer():
+    f = SlipFramer()
+    payloads = [Byt('a'), Byt(0xc0), Byt(0xdb, 0xdc), Byt(0xdb, 0xdd, 0xc0)]
+    stream = Byt().join([f.encode(p) for p in payloads])
+    assert f.feed(stream[:5]) == payloads[:1]
+    assert f.feed(stream[5:]) == payloads[1:]
+
+@raises(TypeError)
+def test_wrong_framer_feed():
+    DelimiterFramer(Byt(0)).feed(b'a')
+
+@raises(TypeError)
+def test_wrong_framer_delimiter():
+    DelimiterFramer(b'a')
+
+@raises(ValueError)
+def test_wrong_framer_encode():
+    DelimiterFramer(Byt(';')).encode(Byt('a;b'))
+
+def test_framer_maxsize_frames():
+    f = DelimiterFramer(Byt(';'), maxsize=4)
+    try:
+        f.feed(Byt('ab;cd;efghijkl'))
+    except ValueError as exc:
+        assert exc.frames == [Byt('ab'), Byt('cd')]
+    else:
+        raise AssertionError("maxsize not enforced")
+    assert len(f) == 0 and f.feed(Byt('x;')) == [Byt('x')]
+    f = LengthFramer('B', maxsize=3)
+    try:
+        f.feed(Byt(1, 97, 2, 98, 99, 9))
+    except ValueError as exc:
+        assert exc.frames == [Byt('a'), Byt('bc')]
+    else:
+        raise AssertionError("maxsize not enforced")
+
+@raises(ValueError)
+def test_framer_maxsize():
+    DelimiterFramer(Byt(';'), maxsize=3).feed(Byt('abcd'))
+
+@raises(ValueError)
+def test_length_framer_maxsize():
+    LengthFramer('B', maxsize=3).feed(Byt(4))
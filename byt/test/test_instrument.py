@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from ..byt import Byt, DByt
+from .. import instrument
+
+
+def test_disabled():
+    assert not instrument.enabled()
+    hex_ = Byt.__dict__['hex']
+    new = Byt.__dict__['__new__']
+    instrument.enable()
+    try:
+        assert instrument.enabled()
+        assert Byt.__dict__['hex'] is not hex_
+        assert Byt('ab').hex() == '61 62'
+        assert Byt.fromHex('61') == Byt('a')
+        assert type(DByt(97)) is DByt
+    finally:
+        instrument.disable()
+    assert not instrument.enabled()
+    assert Byt.__dict__['hex'] is hex_
+    assert Byt.__dict__['__new__'] is new
+    instrument.reset()
+    assert instrument.snapshot() == {}
+
+def test_measure():
+    b = Byt('a,bb,c')
+    with instrument.measure() as stats:
+        b.split(Byt(','))
+        DByt('xyz').hex()
+        b[0]
+        Byt(b)
+    assert not instrument.enabled()
+    assert stats['Byt.split']['calls'] == 1
+    assert stats['Byt.split']['bytes'] == 6
+    # 'a' and 'c' are shared single octets, only 'bb' is built
+    assert stats['Byt.split']['allocations'] == 1
+    assert stats['Byt.hex']['bytes'] == 3
+    assert stats['Byt.__getitem__']['allocations'] == 0
+    # Byt(',') and DByt('xyz'), Byt(b) returns b itself
+    assert stats['Byt.__new__']['allocations'] == 2
+    assert stats['Byt.__new__']['calls'] == 4
+    assert stats['Byt.split']['time'] >= 0
+
+def test_nested_measure():
+    instrument.reset()
+    instrument.enable()
+    try:
+        Byt('a') + Byt('b')
+        with instrument.measure() as stats:
+            Byt('c') + Byt('d')
+        assert instrument.enabled()
+        assert stats['Byt.__add__']['calls'] == 1
+        assert instrument.snapshot()['Byt.__add__']['calls'] == 2
+    finally:
+        instrument.disable()
+        instrument.reset()
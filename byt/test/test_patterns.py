@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from nose.tools import raises
+from ..byt import Byt, DByt
+from ..patterns import PatternSet, HexPattern, compileHexPattern
+
+
+def test_patternset():
+    ps = PatternSet([Byt('he'), Byt('she'), DByt('hers'), Byt('his'),
+                     Byt('e')])
+    assert len(ps) == 5
+    b = Byt('ushers ahishe')
+    res = list(ps.finditer(b))
+    assert res == [(1, 1), (2, 0), (3, 4), (2, 2), (8, 3), (10, 1), (11, 0),
+                   (12, 4)]
+    for offset, idx in res:
+        assert b[offset:offset + len(ps.patterns[idx])] == ps.patterns[idx]
+    assert ps.count(b) == 8
+    assert ps.first(b) == (1, 1)
+    assert ps.first(Byt('xyz')) is None
+    assert ps.count(Byt()) == 0
+    assert list(ps.finditer(DByt('hhe'))) == [(1, 0), (2, 4)]
+    assert list(ps.finditer(b.view(7))) == [(1, 3), (3, 1), (4, 0), (5, 4)]
+
+def test_patternset_bruteforce():
+    data = Byt([(i * 7919) % 13 for i in range(2000)])
+    patterns = [Byt(i % 13, (i * 3) % 13) for i in range(40)] + \
+               [Byt(i % 13) for i in range(5)] + [data[100:110]]
+    expected = []
+    for idx, pattern in enumerate(patterns):
+        pos = data.find(pattern)
+        while pos != -1:
+            expected.append((pos, idx))
+            pos = data.find(pattern, pos + 1)
+    ps = PatternSet(patterns)
+    assert sorted(ps.finditer(data)) == sorted(expected)
+    assert ps.count(data) == len(expected)
+
+def test_hexpattern():
+    p = compileHexPattern('7E ?? 01 4? .. 7E')
+    assert isinstance(p, HexPattern)
+    b = Byt.fromHex('00 7e aa 01 42 00 7e 7e 00 01 4f ff 7e')
+    assert p.search(b) == (1, 7)
+    assert p.search(b, 2) == (7, 13)
+    assert p.search(b, 2, 12) is None
+    assert p.match(b) is None
+    assert p.match(b, 1) == (1, 7)
+    assert list(p.finditer(b)) == [(1, 7), (7, 13)]
+    assert list(p.finditer(DByt(b).view(2))) == [(5, 11)]
+    assert compileHexPattern(Byt('abc').hex()).search(Byt('zabc')) == (1, 4)
+    assert compileHexPattern('0x61 ?2').search(Byt('abc')) == (0, 2)
+    assert compileHexPattern('6162{2} 63').search(Byt('ababc')) == (0, 5)
+    assert compileHexPattern('61 ??{1,2} 64').search(Byt('abcd')) == (0, 4)
+    assert compileHexPattern('61 * 64').search(Byt('abcdd')) == (0, 4)
+    assert compileHexPattern('0a').search(Byt('\n')) == (0, 1)
+    assert compileHexPattern('..').search(Byt('\n')) == (0, 1)
+
+@raises(ValueError)
+def test_wrong_hexpattern():
+    compileHexPattern('7e 0g')
+
+@raises(ValueError)
+def test_wrong_hexpattern_odd():
+    compileHexPattern('7e 123')
+
+@raises(TypeError)
+def test_wrong_hexpattern_search():
+    compileHexPattern('7e').search(b'~')
+
+@raises(TypeError)
+def test_wrong_patternset():
+    PatternSet([Byt('a'), b'b'])
+
+@raises(ValueError)
+def test_wrong_patternset_empty():
+    PatternSet([Byt()])
+
+@raises(TypeError)
+def test_wrong_patternset_search():
+    PatternSet([Byt('a')]).count(b'abc')
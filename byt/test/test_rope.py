@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+import socket
+from io import BytesIO
+from nose.tools import raises
+from ..byt import Byt, DByt
+from ..rope import BytRope
+
+
+def test_rope():
+    r = BytRope()
+    assert len(r) == 0
+    assert r.byt() == Byt()
+    for i in range(1000):
+        r += Byt(i % 256)
+    assert len(r) == 1000
+    assert r.byt() == Byt([i % 256 for i in range(1000)])
+    r = BytRope([Byt('ab'), DByt('cd')]) + Byt('xefx').view(1, 3)
+    r = Byt('yz').view() + r
+    assert r == Byt('yzabcdef')
+    assert Byt('yzabcdef') == r
+    assert r == BytRope([Byt('yza'), Byt('bcdef')])
+    assert r != Byt('yz')
+    assert r.byt() is r.byt()
+    assert hash(r) == hash(Byt('yzabcdef'))
+    assert r.str() == 'yzabcdef'
+    assert r.hex('') == '797a616263646566'
+    assert list(r.segments()) == [Byt('yz'), Byt('ab'), Byt('cd'), Byt('ef')]
+    assert type(BytRope([Byt('a')], DByt).byt()) is DByt
+    assert BytRope([r, r]) == Byt('yzabcdefyzabcdef')
+
+def test_rope_write():
+    r = BytRope([Byt('ab'), Byt(), Byt('cd')]) + Byt('xefx').view(1, 3)
+    f = BytesIO()
+    assert r.writeTo(f) == 6
+    assert f.getvalue() == b'abcdef'
+    if not hasattr(socket, 'socketpair'):
+        return
+    a, b = socket.socketpair()
+    try:
+        assert r.writeTo(a) == 6
+        res = b''
+        while len(res) < 6:
+            res += b.recv(16)
+        assert res == b'abcdef'
+    finally:
+        a.close()
+        b.close()
+
+def test_rope_byt_ops():
+    r = BytRope([Byt('cd')])
+    res = Byt('ab') + r
+    assert isinstance(res, BytRope) and res == Byt('abcd')
+    assert Byt('cd') == r and not Byt('cd') != r
+    assert Byt('cd').view() == r
+    assert Byt('a') != bytearray(b'a') and not Byt('a') == bytearray(b'a')
+    assert Byt('a') != memoryview(b'a')
+    assert Byt('a').view() != bytearray(b'a')
+    assert not Byt('a').view() == memoryview(b'a')
+
+@raises(TypeError)
+def test_wrong_rope():
+    BytRope([Byt('a'), b'b'])
+
+@raises(TypeError)
+def test_wrong_rope_add():
+    BytRope([Byt('a')]) + 'b'
+
+@raises(TypeError)
+def test_wrong_rope_eq():
+    BytRope([Byt('a')]) == b'a'
+
+def test_rope_view_eq():
+    r = BytRope([Byt('ab'), Byt('c')])
+    assert Byt('abc').view() == r
+    assert r == Byt('abc').view()
+    assert not r != Byt('xabc').view(1)
+    assert r != 12
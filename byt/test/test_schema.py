@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+from array import array
+from struct import error as StructError
+from nose.tools import raises
+from ..byt import Byt, DByt
+from ..schema import Schema
+
+
+def test_schema():
+    s = Schema([('id', 'u16'), ('flags', 'bits:3'), ('kind', 'bits:5'),
+                ('payload', 'len-prefixed:u8')])
+    assert s.size is None
+    b = s.encode(1, 2, 3, Byt('hi'))
+    assert b == Byt(0, 1, 0x43, 2, 104, 105)
+    assert s.encode(id=1, flags=2, kind=3, payload=Byt('hi')) == b
+    rec = s.decode(b)
+    assert rec == (1, 2, 3, Byt('hi'))
+    assert rec.payload == Byt('hi')
+    assert s.encode(*rec) == b
+    assert s.decodeFrom(Byt('x') + b, 1) == (rec, 7)
+    assert type(s.decode(DByt(b)).payload) is DByt
+    assert s.decode((Byt('x') + b).view(1)) == rec
+    assert list(s.iterDecode(b * 3)) == [rec] * 3
+    cols = s.decodeColumns(b * 2)
+    assert list(cols.keys()) == ['id', 'flags', 'kind', 'payload']
+    assert cols['id'] == array('H', [1, 1])
+    assert cols['payload'] == [Byt('hi'), Byt('hi')]
+
+def test_schema_fixed():
+    s = Schema([('a', 'u8'), ('b', 'bits:4'), ('c', 'bits:12'),
+                ('d', 'bytes:2'), ('e', 'i16')], '<')
+    assert s.size == 7
+    b = s.encode(1, 2, 3, Byt('xy'), -1) + s.encode(4, 5, 6, Byt('zt'), 7)
+    assert b[:7] == Byt(1, 3, 0x20, 120, 121, 255, 255)
+    assert list(s.iterDecode(b)) == [(1, 2, 3, Byt('xy'), -1),
+                                     (4, 5, 6, Byt('zt'), 7)]
+    cols = s.decodeColumns(b)
+    assert cols['a'] == array('B', [1, 4])
+    assert list(cols['c']) == [3, 6]
+    assert list(cols['e']) == [-1, 7]
+    assert cols['d'] == [Byt('xy'), Byt('zt')]
+    assert s.decodeColumns(Byt())['d'] == []
+    assert s.decodeColumns(b, 7)['a'] == array('B', [4])
+
+@raises(TypeError)
+def test_wrong_schema_encode():
+    Schema([('p', 'len-prefixed')]).encode(b'a')
+
+@raises(ValueError)
+def test_wrong_schema_size():
+    Schema([('p', 'bytes:2')]).encode(Byt('abc'))
+
+@raises(ValueError)
+def test_wrong_schema_bits():
+    Schema([('a', 'bits:3'), ('b', 'u8')])
+
+def test_schema_builtin_names():
+    s = Schema([('len', 'u8'), ('type', 'bytes:2'),
+                ('payload', 'len-prefixed')])
+    data = s.encode(1, Byt('ab'), Byt('xyz'))
+    assert data == Byt([1, 97, 98, 0, 3, 120, 121, 122])
+    assert s.decode(data) == (1, Byt('ab'), Byt('xyz'))
+
+@raises(ValueError)
+def test_wrong_schema_type():
+    Schema([('a', 'u24')])
+
+@raises(ValueError)
+def test_wrong_schema_name():
+    Schema([('_a', 'u8')])
+
+@raises(TypeError)
+def test_wrong_schema_decode():
+    Schema([('a', 'u8')]).decode(b'a')
+
+@raises(StructError)
+def test_wrong_schema_truncated():
+    Schema([('p', 'len-prefixed:u8')]).decode(Byt(3, 1))
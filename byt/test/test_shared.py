@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+import pickle
+from multiprocessing import Pool
+from sys import version_info
+from nose.tools import raises
+from ..byt import Byt, DByt, BytView
+if version_info >= (3, 8):
+    from ..shared import share
+
+
+def _count(shared):
+    view = shared.view()
+    res = view.count(Byt('ab')), type(view[:2].byt()).__name__
+    shared.close()
+    return res
+
+def test_share():
+    if version_info < (3, 8):
+        return
+    with share(DByt('abcab')) as s:
+        assert len(s) == 5
+        v = s.view()
+        assert isinstance(v, BytView) and v == DByt('abcab')
+        assert type(s.byt()) is DByt
+        assert v.find(Byt('ca')) == 2
+        other = pickle.loads(pickle.dumps(s))
+        assert other.name == s.name and other.view() == Byt('abcab')
+        other.close()
+    with share(Byt('xabcx').view(1, 4)) as s:
+        assert s.byt() == Byt('abc') and type(s.byt()) is Byt
+    with share(Byt()) as s:
+        assert len(s) == 0 and s.byt() == Byt()
+
+def test_pool():
+    if version_info < (3, 8):
+        return
+    with share(DByt('abc' * 1000)) as s:
+        pool = Pool(2)
+        try:
+            assert pool.map(_count, [s, s]) == [(1000, 'DByt')] * 2
+        finally:
+            pool.close()
+            pool.join()
+
+@raises(TypeError)
+def test_wrong_share():
+    if version_info < (3, 8):
+        raise TypeError
+    share(b'abc')
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+#  
+#  byt - Version-independent bytes-chains
+#  Copyright (C) 2016-2017  Guillaume Schworer
+#  
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#  
+#  For any information, bug report, idea, donation, hug, beer, please contact
+#    guillaume.schworer@gmail.com
+#
+###############################################################################
+
+
+
+
+import subprocess
+import sys
+from os import environ
+from types import FunctionType
+from nose.tools import raises
+from ..byt import Byt, DByt, PYTHON3, SPEEDUPS, _SINGLES, _singles
+
+
+def test_selected():
+    if not PYTHON3:
+        return
+    methods = ('__new__', '__getitem__', '__iter__', '__eq__', '__ne__')
+    for name in methods:
+        method = Byt.__dict__[name]
+        if name == '__new__':
+            method = method.__func__
+        assert isinstance(method, FunctionType) is not SPEEDUPS
+    assert isinstance(Byt.__dict__['hex'], FunctionType)
+
+def test_new():
+    if not PYTHON3:
+        return
+    b = Byt('ab')
+    assert Byt(b) is b
+    assert type(DByt(b)) is DByt
+    assert Byt(0) is Byt(b'\x00')[0]
+    assert Byt(u'\xe9') == Byt([233])
+    assert Byt(bytearray(b'ab')) == Byt(memoryview(b'ab')) == b
+    assert Byt((97, 98)) == Byt([97, 98]) == Byt(97, 98) == b
+    assert Byt(b.view()) == b and Byt(True) == Byt(1)
+
+def test_getitem_iter():
+    if not PYTHON3:
+        return
+    b = DByt('abc')
+    assert b[0] is b[-3] is DByt(97)
+    assert type(b[1:]) is DByt and b[::2] == DByt('ac')
+    assert list(b) == [DByt('a'), DByt('b'), DByt('c')]
+    it = iter(Byt('ab'))
+    assert next(it) is Byt(97) and next(it) is Byt(98)
+    assert list(it) == [] and list(it) == []
+
+def test_hex():
+    if not PYTHON3:
+        return
+    b = Byt(range(1, 6))
+    assert b.hex() == '01 02 03 04 05'
+    assert b.hex('') == b.hex(' ', 0) == '0102030405'
+    assert b.hex(':', 2, True) == '0102:0304:05'
+    assert b.hex('--', group=3) == '010203--0405'
+    assert b.hex(u'\xe9') == u'01\xe902\xe903\xe904\xe905'
+    assert Byt().hex() == ''
+
+def test_hex_modes():
+    if not PYTHON3:
+        return
+    code = "from byt import Byt; b = Byt('ab\\x00\\xff'); " \
+           "print([b.hex(), b.hex('x', upper=True), b.hex(':', 2, True)])"
+    res = set()
+    for value in ('', '1'):
+        env = dict(environ, BYT_NO_SPEEDUPS=value)
+        res.add(subprocess.check_output([sys.executable, '-c', code],
+                                        env=env))
+    assert len(res) == 1
+
+def test_eq():
+    if not PYTHON3:
+        return
+    assert Byt('a') == DByt('a') and not Byt('a') != DByt('a')
+    assert Byt('a') == Byt('a').view()
+    assert Byt('a') != 3
+
+def test_install():
+    if not SPEEDUPS:
+        return
+    from .._speedups import install
+    assert install(Byt, _SINGLES, _singles) is True
+    assert install(DByt, _SINGLES, _singles) is False
+
+@raises(TypeError)
+def test_wrong_new_cls():
+    if not PYTHON3:
+        raise TypeError
+    Byt.__new__(int, b'ab')
+
+@raises(TypeError)
+def test_wrong_new_type():
+    if not PYTHON3:
+        raise TypeError
+    Byt.__new__(5, b'ab')
+
+@raises(IndexError)
+def test_wrong_getitem():
+    if not PYTHON3:
+        raise IndexError
+    Byt('a')[1]
+
+@raises(ValueError)
+def test_wrong_new():
+    if not PYTHON3:
+        raise ValueError
+    Byt(2 ** 70)
+
+@raises(TypeError)
+def test_wrong_eq():
+    if not PYTHON3:
+        raise TypeError
+    Byt('a') == b'a'
+
+@raises(TypeError)
+def test_wrong_hex():
+    if not PYTHON3:
+        raise TypeError
+    Byt('a').hex(' ', 1, False, 0)
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from sys import argv, exit
-import re, os
+import re, os, sys
 
 m = open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "byt", "byt.py")).read()
 version = re.findall(r"__version__ *= *\"(.*?)\"", m)[0]
@@ -14,19 +14,26 @@ if "upl" in argv[1:]:
     exit()
 
 try:
-    from setuptools import setup
+    from setuptools import setup, Extension
     setup
 except ImportError:
-    from distutils.core import setup
+    from distutils.core import setup, Extension
     setup
 
+# optional compiled accelerator, byt falls back to pure python without it
+ext_modules = []
+if sys.version_info >= (3, 7):
+    ext_modules.append(Extension("byt._speedups", ["byt/_speedups.c"],
+                                 optional=True))
+
 
 setup(
     name="byt",
     version=version,
     author="Guillaume Schworer",
     author_email="guillaume.schworer@gmail.com",
-    packages=["byt"],
+    packages=["byt", "byt.bench"],
+    ext_modules=ext_modules,
     url="https://github.com/ceyzeriat/byt/",
     license="GNU",
     description="Version-independent bytes-chains",